@@ -0,0 +1,78 @@
+import numpy as np
+
+
+class BinaryCodeDecoder:
+    DIRECT = 'direct'
+    REVERSE = 'reverse'
+    ADDITIONAL = 'additional'
+    CODES = (DIRECT, REVERSE, ADDITIONAL)
+    CHUNK_ROWS = 1 << 20
+    WORD_BITS = 64
+
+    def __init__(self, width: int = 32, code: str = ADDITIONAL):
+        if not 2 <= width <= self.WORD_BITS:
+            raise ValueError(f"Разрядность должна быть от 2 до {self.WORD_BITS}")
+        if code not in self.CODES:
+            raise ValueError(f"Неизвестный код: {code}")
+        self.width = width
+        self.code = code
+
+    def pack_bits(self, bits: np.ndarray) -> np.ndarray:
+        # (N, width) из 0/1 -> N беззнаковых слов, старший бит - первый символ
+        padded = np.zeros((bits.shape[0], self.WORD_BITS), dtype=np.uint8)
+        padded[:, self.WORD_BITS - self.width:] = bits
+        return np.packbits(padded, axis=1).view('>u8').ravel().astype(np.uint64)
+
+    def apply_sign(self, words: np.ndarray) -> np.ndarray:
+        sign_shift = np.uint64(self.width - 1)
+        magnitude_mask = np.uint64((1 << (self.width - 1)) - 1)
+        negative = (words >> sign_shift).astype(bool)
+        magnitude = (words & magnitude_mask).astype(np.int64)
+        if self.code == self.DIRECT:
+            return np.where(negative, -magnitude, magnitude)
+        if self.code == self.REVERSE:
+            inverted = (~words & magnitude_mask).astype(np.int64)
+            return np.where(negative, -inverted, magnitude)
+        return magnitude - (negative.astype(np.int64) << np.int64(self.width - 1))
+
+    def decode_matrix(self, symbols: np.ndarray) -> np.ndarray:
+        bits = symbols - np.uint8(ord('0'))
+        if bits.size and bits.max() > 1:
+            raise ValueError("Код может содержать только символы 0 и 1")
+        return self.apply_sign(self.pack_bits(bits))
+
+    def record_size(self, data: bytes) -> int:
+        if len(data) <= self.width or data[self.width:self.width + 1] not in (b'\n', b'\r'):
+            raise ValueError(f"Ожидались записи длиной {self.width} символов")
+        return self.width + (2 if data[self.width:self.width + 2] == b'\r\n' else 1)
+
+    def decode_buffer(self, data: bytes) -> np.ndarray:
+        if not data:
+            return np.empty(0, dtype=np.int64)
+        stride = self.record_size(data + b'\n')
+        tail = len(data) % stride
+        if tail == self.width:
+            data += b'\n' * (stride - self.width)
+        elif tail:
+            raise ValueError("Размер данных не кратен длине записи")
+        symbols = np.frombuffer(data, dtype=np.uint8).reshape(-1, stride)[:, :self.width]
+        return self.decode_matrix(symbols)
+
+    def iter_file(self, path: str, chunk_rows: int = CHUNK_ROWS):
+        with open(path, 'rb') as file:
+            head = file.read(self.width + 2)
+            if not head:
+                return
+            stride = self.record_size(head + b'\n')
+            file.seek(0)
+            while True:
+                chunk = file.read(stride * chunk_rows)
+                if not chunk:
+                    break
+                yield self.decode_buffer(chunk)
+
+    def decode_file(self, path: str) -> np.ndarray:
+        chunks = list(self.iter_file(path))
+        if not chunks:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(chunks)
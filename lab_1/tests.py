@@ -1,5 +1,8 @@
+import os
+import tempfile
 import unittest
 from run import *
+from bulk_decoder import BinaryCodeDecoder
 
 
 class TestMethods(unittest.TestCase):
@@ -56,6 +59,55 @@ class TestMethods(unittest.TestCase):
         self.assertEqual(self.method.div_of_binary_numbers("11110101", "00011001"), "10111110111000010100011110101110")
 
 
+class TestBinaryCodeDecoder(unittest.TestCase):
+    def setUp(self):
+        self.numbers = [11, -11, 25, -25, 1, -1, 2 ** 31 - 1, -(2 ** 31 - 1)]
+
+    def encode(self, converter):
+        return "\n".join(converter(n) for n in self.numbers).encode()
+
+    def test_direct_code(self):
+        decoder = BinaryCodeDecoder(32, BinaryCodeDecoder.DIRECT)
+        data = self.encode(Methods.convert_to_binary_number)
+        self.assertEqual(decoder.decode_buffer(data).tolist(), self.numbers)
+
+    def test_reverse_code(self):
+        decoder = BinaryCodeDecoder(32, BinaryCodeDecoder.REVERSE)
+        data = self.encode(Methods.convert_to_reverse_binary)
+        self.assertEqual(decoder.decode_buffer(data).tolist(), self.numbers)
+
+    def test_additional_code(self):
+        decoder = BinaryCodeDecoder(32, BinaryCodeDecoder.ADDITIONAL)
+        data = self.encode(Methods.convert_to_additional_binary)
+        self.assertEqual(decoder.decode_buffer(data).tolist(), self.numbers)
+
+    def test_matches_convert_to_decimal(self):
+        decoder = BinaryCodeDecoder(8)
+        codes = ["00001011", "11110101", "10000000", "01111111"]
+        result = decoder.decode_buffer("\r\n".join(codes).encode())
+        self.assertEqual(result.tolist(), [Methods.convert_to_decimal(c) for c in codes])
+
+    def test_file_in_chunks(self):
+        decoder = BinaryCodeDecoder(32, BinaryCodeDecoder.ADDITIONAL)
+        data = self.encode(Methods.convert_to_additional_binary) + b"\n"
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(data * 5)
+        try:
+            chunks = list(decoder.iter_file(file.name, chunk_rows=3))
+            self.assertEqual(len(chunks), 14)
+            self.assertEqual(decoder.decode_file(file.name).tolist(), self.numbers * 5)
+        finally:
+            os.remove(file.name)
+
+    def test_invalid_input(self):
+        decoder = BinaryCodeDecoder(8)
+        with self.assertRaises(ValueError):
+            decoder.decode_buffer(b"0000102\n")
+        with self.assertRaises(ValueError):
+            decoder.decode_buffer(b"0101\n")
+        with self.assertRaises(ValueError):
+            BinaryCodeDecoder(8, "gray")
+
 
 if __name__ == '__main__':
     unittest.main()
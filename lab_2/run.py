@@ -1,9 +1,77 @@
-import re
 from itertools import product
+from formula_ast import Parser
+
+
+class TruthTable:
+    # Упакованная таблица истинности: бит i вектора - значение функции
+    # в i-й строке, строки упорядочены по переменным variables
+    BYTE_ONES = [[bit for bit in range(8) if byte >> bit & 1] for byte in range(256)]
+
+    def __init__(self, variables, vector):
+        self.variables = list(variables)
+        self.vector = vector
+        self.size = 1 << len(self.variables)
+
+    @classmethod
+    def from_bytes(cls, variables, data):
+        return cls(variables, int.from_bytes(data, "little"))
+
+    def to_bytes(self):
+        return self.vector.to_bytes((self.size + 7) // 8, "little")
+
+    def iter_values(self):
+        bits = format(self.vector, f"0{self.size}b")
+        for index in range(self.size - 1, -1, -1):
+            yield bits[index] == "1"
+
+    def index_to_values(self, index):
+        count = len(self.variables)
+        return [bool(index >> (count - position - 1) & 1) for position in range(count)]
+
+    def get_rows(self):
+        combinations = product([False, True], repeat=len(self.variables))
+        return [list(values) + [result] for values, result in zip(combinations, self.iter_values())]
+
+    def iter_minterms(self):
+        for offset, byte in enumerate(self.to_bytes()):
+            for bit in self.BYTE_ONES[byte]:
+                yield offset * 8 + bit
+
+    def iter_maxterms(self):
+        for offset, byte in enumerate(self.to_bytes()):
+            for bit in self.BYTE_ONES[byte ^ 0xFF]:
+                index = offset * 8 + bit
+                if index >= self.size:
+                    return
+                yield index
+
+    def minterms(self):
+        return list(self.iter_minterms())
+
+    def maxterms(self):
+        return list(self.iter_maxterms())
+
+    def get_index_form(self):
+        result_string = format(self.vector, f"0{self.size}b")[::-1]
+        return result_string, int(result_string, 2)
 
 
 class Formula:
     MAX_BITS = 7
+    BOOLEAN_TEMPLATES = {
+        "!": "not {0}",
+        "&": "{0} and {1}",
+        "|": "{0} or {1}",
+        "->": "not {0} or {1}",
+        "~": "{0} == {1}",
+    }
+    BITWISE_TEMPLATES = {
+        "!": "full ^ {0}",
+        "&": "{0} & {1}",
+        "|": "{0} | {1}",
+        "->": "full ^ {0} | {1}",
+        "~": "full ^ {0} ^ {1}",
+    }
 
     def __init__(self, formula):
         self.operators = {
@@ -15,6 +83,15 @@ class Formula:
         }
         self.expression = formula.replace('∨', '|').replace('∧', '&').replace('→', '->').replace('↔', '~')
 
+    @property
+    def expression(self):
+        return self._expression
+
+    @expression.setter
+    def expression(self, value):
+        self._expression = value
+        self._cache = {}
+
     @classmethod
     def get_positive_binary_number(cls, decimal_number) :
         if decimal_number < 0:
@@ -43,8 +120,11 @@ class Formula:
             return -cls.binary_to_decimal_number(inverted) - 1
         return cls.binary_to_decimal_number(binary_number)
 
+    def get_ast(self):
+        return self._get_cached("ast", lambda: Parser(self.operators).parse(self.expression))
+
     def get_variables(self):
-        return sorted(set(re.findall(r'[a-zA-Z]', self.expression)))
+        return self._get_cached("variables", lambda: self.get_ast().get_variables())
 
     def combinations(self):
         variables = self.get_variables()
@@ -52,46 +132,11 @@ class Formula:
             yield dict(zip(variables, combination))
 
     def tokenize(self):
-        tokens = []
-        i = 0
-        while i < len(self.expression):
-            if self.expression[i] in "()!&|~":
-                if self.expression[i] == "-" and i + 1 < len(self.expression) and self.expression[i + 1] == ">":
-                    tokens.append("->")
-                    i += 2
-                    continue
-                tokens.append(self.expression[i])
-                i += 1
-            elif self.expression[i].isalpha():
-                var = []
-                while i < len(self.expression) and self.expression[i].isalpha():
-                    var.append(self.expression[i])
-                    i += 1
-                tokens.append("".join(var))
-            else:
-                i += 1
-        return tokens
+        return [token for token, _ in Parser(self.operators).tokenize(self.expression)]
 
     def to_postfix(self, tokens):
-        output = []
-        stack = []
-        for token in tokens:
-            if token == "(":
-                stack.append(token)
-            elif token == ")":
-                while stack[-1] != "(":
-                    output.append(stack.pop())
-                stack.pop()
-            elif token in self.operators:
-                while stack and stack[-1] != "(" and self.operators[token]["priority"] <= \
-                        self.operators.get(stack[-1], {"priority": -1})["priority"]:
-                    output.append(stack.pop())
-                stack.append(token)
-            else:
-                output.append(token)
-        while stack:
-            output.append(stack.pop())
-        return output
+        positioned = [(token, position) for position, token in enumerate(tokens)]
+        return Parser(self.operators).parse_tokens(positioned).to_postfix()
 
     def evaluate_postfix(self, postfix, variables):
         stack = []
@@ -116,76 +161,145 @@ class Formula:
                 stack.append(variables[token])
         return stack[0]
 
+    def _get_cached(self, key, factory):
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    def get_postfix(self):
+        return self._get_cached("postfix", lambda: self.get_ast().to_postfix())
+
+    def compile(self, variables=None, bitwise=False):
+        # Разбор выполняется один раз: каждый уникальный узел дерева становится
+        # присваиванием во временную переменную линейного кода
+        if variables is None:
+            variables = self.get_variables()
+        key = ("compiled", tuple(variables), bitwise)
+        return self._get_cached(key, lambda: self._build_evaluator(variables, bitwise))
+
+    def _build_evaluator(self, variables, bitwise):
+        arguments = {var: f"v{i}" for i, var in enumerate(variables)}
+        templates = self.BITWISE_TEMPLATES if bitwise else self.BOOLEAN_TEMPLATES
+        lines = []
+        names = {}
+        for node in self.get_ast().iter_nodes():
+            if node.is_variable:
+                if node.name not in arguments:
+                    raise ValueError(f"Не указаны переменные: {{'{node.name}'}}")
+                names[node] = arguments[node.name]
+            else:
+                operands = [names[child] for child in node.children]
+                names[node] = f"t{len(lines)}"
+                lines.append(f"    {names[node]} = {templates[node.operator].format(*operands)}")
+        root = names[self.get_ast()]
+        parameters = list(arguments.values()) + (["full"] if bitwise else [])
+        result = root if bitwise else f"bool({root})"
+        source = (f"def evaluate({', '.join(parameters)}):\n"
+                  + "".join(line + "\n" for line in lines)
+                  + f"    return {result}\n")
+        namespace = {}
+        exec(compile(source, f"<formula {self.expression}>", "exec"), namespace)
+        return namespace["evaluate"]
+
     def evaluate_of_expr(self, **variables):
-        tokens = self.tokenize()
-        missing = set(t for t in tokens if t.isalpha()) - set(variables.keys())
+        names = self.get_variables()
+        missing = set(names) - set(variables.keys())
         if missing:
             raise ValueError(f"Не указаны переменные: {missing}")
-        postfix = self.to_postfix(tokens)
-        return self.evaluate_postfix(postfix, variables)
+        return self.compile(names)(*(variables[name] for name in names))
 
-    def create_table_of_truth(self):
+    @staticmethod
+    def get_variable_masks(variables):
+        # бит i маски - значение переменной в i-й строке таблицы истинности
+        size = 1 << len(variables)
+        full = (1 << size) - 1
+        masks = {}
+        for position, var in enumerate(variables):
+            block = 1 << (len(variables) - position - 1)
+            mask = ((1 << block) - 1) << block
+            width = 2 * block
+            while width < size:
+                mask |= mask << width
+                width *= 2
+            masks[var] = mask
+        return masks, full
+
+    def get_truth_table(self):
+        return self._get_cached("truth_table", self._build_truth_table)
+
+    def _build_truth_table(self):
         variables = self.get_variables()
-        combinations = list(self.combinations())
-        result_of_expr = []
-        table = []
-        for combo in combinations:
-            result = self.evaluate_of_expr(**combo)
-            result_of_expr.append(result)
-            row = list(combo.values()) + [result]
-            table.append(row)
+        masks, full = self.get_variable_masks(variables)
+        evaluate = self.compile(variables, bitwise=True)
+        return TruthTable(variables, evaluate(*(masks[var] for var in variables), full))
+
+    def get_truth_vector(self):
+        return self.get_truth_table().vector
+
+    def create_table_of_truth(self):
+        truth_table = self.get_truth_table()
+        return truth_table.get_rows(), truth_table.variables + ["Result"], list(truth_table.iter_values())
+
+    def iter_cnf_clauses(self):
+        truth_table = self.get_truth_table()
+        for index in truth_table.iter_maxterms():
+            values = truth_table.index_to_values(index)
+            clause = []
+            for i, var in enumerate(truth_table.variables):
+                if values[i]:
+                    clause.append(f'¬{var}')
+                else:
+                    clause.append(var)
+            yield f"({' ∨ '.join(clause)})"
+
+    def iter_dnf_terms(self):
+        truth_table = self.get_truth_table()
+        for index in truth_table.iter_minterms():
+            values = truth_table.index_to_values(index)
+            clause = []
+            for i, var in enumerate(truth_table.variables):
+                if values[i]:
+                    clause.append(var)
+                else:
+                    clause.append(f'¬{var}')
+            yield f"({' ∧ '.join(clause)})"
 
-        return table, variables + ["Result"], result_of_expr
+    @staticmethod
+    def _write_terms(fp, terms, separator, empty):
+        count = 0
+        for term in terms:
+            if count:
+                fp.write(separator)
+            fp.write(term)
+            count += 1
+        if not count:
+            fp.write(empty)
+        return count
+
+    def write_cnf(self, fp):
+        return self._write_terms(fp, self.iter_cnf_clauses(), " ∧ ", "True")
+
+    def write_dnf(self, fp):
+        return self._write_terms(fp, self.iter_dnf_terms(), " ∨ ", "False")
 
     def to_cnf(self):
-        table, headers, result_of_expr = self.create_table_of_truth()
-        variables = headers[:-1]
-        cnf = []
-
-        for row in table:
-            if not row[-1]:
-                clause = []
-                for i, var in enumerate(variables):
-                    if row[i]:
-                        clause.append(f'¬{var}')
-                    else:
-                        clause.append(var)
-                cnf.append(f"({' ∨ '.join(clause)})")
-
-        return " ∧ ".join(cnf) if cnf else "True"
+        cnf = " ∧ ".join(self.iter_cnf_clauses())
+        return cnf if cnf else "True"
 
     def to_dnf(self):
-        table, headers, result_of_expr = self.create_table_of_truth()
-        variables = headers[:-1]
-        dnf = []
-
-        for row in table:
-            if row[-1]:
-                clause = []
-                for i, var in enumerate(variables):
-                    if row[i]:
-                        clause.append(var)
-                    else:
-                        clause.append(f'¬{var}')
-                dnf.append(f"({' ∧ '.join(clause)})")
-
-        return " ∨ ".join(dnf) if dnf else "False"
+        dnf = " ∨ ".join(self.iter_dnf_terms())
+        return dnf if dnf else "False"
 
     def get_number_forms(self):
-        table, headers, result_of_expr = self.create_table_of_truth()
-        variables = headers[:-1]
-        number_form_of_disjunction = []
-        number_form_of_conjunction = []
-        for row in table:
-            if row[-1]:
-                binary = ''.join(str(int(v)) for v in row[:-1])
-                number_form_of_disjunction.append(self.binary_to_decimal_number(binary))
-            else:
-                binary = ''.join(str(int(v)) for v in row[:-1])
-                number_form_of_conjunction.append(self.binary_to_decimal_number(binary))
+        truth_table = self.get_truth_table()
+        number_form_of_disjunction = truth_table.minterms()
+        number_form_of_conjunction = truth_table.maxterms()
         return  "(" +  ",".join(map(str,number_form_of_disjunction))+ ")" + " v" \
                "\n""(" + ",".join(map(str,  number_form_of_conjunction)) + ")" + " ∧"
 
+    def get_index_form(self):
+        return self.get_truth_table().get_index_form()
+
 
 def main():
     expr = '(a∨b)∧!c'
@@ -201,8 +315,8 @@ def main():
     print("\nСовершенная ДНФ (СДНФ):", formula.to_dnf())
     print("Совершенная КНФ (СКНФ):", formula.to_cnf())
     print("\nЧисловые формы:\n", formula.get_number_forms())
-    result_string = "".join(map(str,(map(int, result_of_expr))))
-    print("\nИндексная форма: ",result_string+" -",formula.binary_to_decimal_number(result_string))
+    result_string, index = formula.get_index_form()
+    print("\nИндексная форма: ",result_string+" -",index)
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import io
 import unittest
 from run import Formula
 
@@ -13,12 +14,13 @@ class TestFormula(unittest.TestCase):
         self.assertEqual(self.complex_formula.get_variables(), ['a', 'b', 'c'])
 
     def test_tokenize(self):
-        self.assertEqual(self.implication_formula.tokenize(), ['a', 'b'])
-        self.assertEqual(self.unicode_formula.tokenize(), ['a', '|', 'b', 'c', '~', 'd'])
+        self.assertEqual(self.implication_formula.tokenize(), ['a', '->', 'b'])
+        self.assertEqual(self.complex_formula.tokenize(), ['(', 'a', '|', 'b', ')', '&', '!', 'c'])
+        self.assertEqual(self.unicode_formula.tokenize(), ['a', '|', 'b', '->', 'c', '~', 'd'])
 
     def test_postfix_conversion(self):
         postfix = self.implication_formula.to_postfix(self.implication_formula.tokenize())
-        self.assertEqual(postfix, ['a', 'b'])
+        self.assertEqual(postfix, ['a', 'b', '->'])
 
     def test_evaluate_postfix(self):
         tokens = self.simple_formula.tokenize()
@@ -54,11 +56,57 @@ class TestFormula(unittest.TestCase):
         _, _, results = self.complex_formula.create_table_of_truth()
         result_str = ''.join(str(int(r)) for r in results)
         decimal = Formula.binary_to_decimal_number(result_str)
-        self.assertEqual(decimal, 21)
+        self.assertEqual(decimal, 42)
 
     def test_implication(self):
         _, _, results = self.implication_formula.create_table_of_truth()
-        self.assertEqual(results, [False, False, True, True])
+        self.assertEqual(results, [True, True, False, True])
+
+    def test_variable_masks(self):
+        masks, full = Formula.get_variable_masks(['a', 'b'])
+        self.assertEqual(full, 0b1111)
+        self.assertEqual(masks, {'a': 0b1100, 'b': 0b1010})
+
+    def test_truth_vector(self):
+        self.assertEqual(self.simple_formula.get_truth_vector(), 0b1000)
+        self.assertEqual(self.complex_formula.get_index_form(), ("00101010", 42))
+
+    def test_compile(self):
+        evaluate = self.simple_formula.compile()
+        self.assertTrue(evaluate(True, True))
+        self.assertFalse(evaluate(*(True, False)))
+        self.assertIs(self.simple_formula.compile(), evaluate)
+
+    def test_truth_table_is_shared(self):
+        formula = Formula("a ∨ b")
+        truth_table = formula.get_truth_table()
+        formula.to_dnf()
+        formula.get_number_forms()
+        self.assertIs(formula.get_truth_table(), truth_table)
+        self.assertEqual(truth_table.to_bytes(), bytes([0b1110]))
+
+    def test_write_forms(self):
+        formula = Formula("a ∨ b")
+        buffer = io.StringIO()
+        self.assertEqual(formula.write_dnf(buffer), 3)
+        self.assertEqual(buffer.getvalue(), formula.to_dnf())
+        buffer = io.StringIO()
+        self.assertEqual(formula.write_cnf(buffer), 1)
+        self.assertEqual(buffer.getvalue(), "(a ∨ b)")
+
+    def test_invalid_expression(self):
+        with self.assertRaises(ValueError):
+            Formula("a & b$").get_truth_vector()
+        with self.assertRaises(ValueError):
+            Formula("(a | b").get_truth_vector()
+
+    def test_deep_nesting(self):
+        text = "x0"
+        for i in range(1, 1000):
+            text = f"(x{i} | {text})"
+        self.assertEqual(len(Formula(text).get_variables()), 1000)
+        nested = Formula("!(" * 1000 + "a" + ")" * 1000 + " | b")
+        self.assertEqual(nested.get_truth_vector(), Formula("a | b").get_truth_vector())
 
     def test_unicode_replacements(self):
         self.assertEqual(self.unicode_formula.expression, "a|b->c~d")
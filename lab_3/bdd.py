@@ -0,0 +1,257 @@
+class BDD:
+    # Редуцированная упорядоченная диаграмма решений. Узел - целое число:
+    # 0 и 1 - терминалы, остальные - индексы в таблицах _level/_low/_high
+    FALSE = 0
+    TRUE = 1
+
+    def __init__(self, order=None):
+        self.order = []
+        self.levels = {}
+        self._level = [None, None]
+        self._low = [None, None]
+        self._high = [None, None]
+        self._unique = {}
+        self._ite_cache = {}
+        self._restrict_cache = {}
+        self._cover_cache = {}
+        for var in order or []:
+            self.add_variable(var)
+
+    def add_variable(self, var):
+        if var not in self.levels:
+            self.levels[var] = len(self.order)
+            self.order.append(var)
+        return self.levels[var]
+
+    def level(self, node):
+        if node <= self.TRUE:
+            return len(self.order)
+        return self._level[node]
+
+    def _make(self, level, low, high):
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            node = len(self._level)
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+            self._unique[key] = node
+        return node
+
+    def variable(self, var):
+        return self._make(self.add_variable(var), self.FALSE, self.TRUE)
+
+    def _cofactors(self, node, level):
+        if self.level(node) != level:
+            return node, node
+        return self._low[node], self._high[node]
+
+    def ite(self, f, g, h):
+        if f == self.TRUE:
+            return g
+        if f == self.FALSE:
+            return h
+        if g == h:
+            return g
+        if g == self.TRUE and h == self.FALSE:
+            return f
+        key = (f, g, h)
+        result = self._ite_cache.get(key)
+        if result is None:
+            level = min(self.level(f), self.level(g), self.level(h))
+            f0, f1 = self._cofactors(f, level)
+            g0, g1 = self._cofactors(g, level)
+            h0, h1 = self._cofactors(h, level)
+            result = self._make(level, self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+            self._ite_cache[key] = result
+        return result
+
+    def negate(self, f):
+        return self.ite(f, self.FALSE, self.TRUE)
+
+    def apply(self, operator, a, b=None):
+        if operator == '!':
+            return self.negate(a)
+        if operator == '&':
+            return self.ite(a, b, self.FALSE)
+        if operator == '|':
+            return self.ite(a, self.TRUE, b)
+        if operator == '->':
+            return self.ite(a, b, self.TRUE)
+        if operator == '~':
+            return self.ite(a, b, self.negate(b))
+        raise ValueError(f"Неизвестный оператор: {operator}")
+
+    def from_formula(self, formula):
+        for var in formula.get_variables():
+            self.add_variable(var)
+        return self.from_ast(formula.get_ast())
+
+    def from_ast(self, root):
+        nodes = {}
+        for node in root.iter_nodes():
+            if node.is_variable:
+                nodes[node] = self.variable(node.name)
+            else:
+                nodes[node] = self.apply(node.operator, *(nodes[child] for child in node.children))
+        return nodes[root]
+
+    def restrict(self, node, var, value):
+        level = self.levels[var]
+        key = (node, level, value)
+        result = self._restrict_cache.get(key)
+        if result is None:
+            node_level = self.level(node)
+            if node_level > level:
+                result = node
+            elif node_level == level:
+                result = self._high[node] if value else self._low[node]
+            else:
+                result = self._make(node_level,
+                                    self.restrict(self._low[node], var, value),
+                                    self.restrict(self._high[node], var, value))
+            self._restrict_cache[key] = result
+        return result
+
+    def support(self, node):
+        levels = set()
+        stack = [node]
+        seen = set()
+        while stack:
+            current = stack.pop()
+            if current <= self.TRUE or current in seen:
+                continue
+            seen.add(current)
+            levels.add(self._level[current])
+            stack.append(self._low[current])
+            stack.append(self._high[current])
+        return [self.order[level] for level in sorted(levels)]
+
+    def is_satisfiable(self, node):
+        return node != self.FALSE
+
+    def is_tautology(self, node):
+        return node == self.TRUE
+
+    def count_models(self, node, variables=None):
+        # Число наборов над всеми переменными диаграммы, затем - над variables
+        counts = {self.FALSE: 0, self.TRUE: 1}
+
+        def count(current):
+            if current not in counts:
+                level = self._level[current]
+                low, high = self._low[current], self._high[current]
+                counts[current] = (count(low) << (self.level(low) - level - 1)) + \
+                                  (count(high) << (self.level(high) - level - 1))
+            return counts[current]
+
+        models = count(node) << self.level(node)
+        if variables is None:
+            return models
+        missing = set(self.support(node)) - set(variables)
+        if missing:
+            raise ValueError(f"Не указаны переменные: {missing}")
+        extra = len(set(self.order) - set(variables))
+        absent = len(set(variables) - set(self.order))
+        return models >> extra << absent
+
+    def equivalent(self, f, g):
+        return f == g
+
+    def iter_minterms(self, node, variables):
+        # Номера наборов в порядке таблицы истинности над variables
+        missing = set(self.support(node)) - set(variables)
+        if missing:
+            raise ValueError(f"Не указаны переменные: {missing}")
+
+        def walk(current, position, index):
+            if current == self.FALSE:
+                return
+            if position == len(variables):
+                yield index
+                return
+            var = variables[position]
+            if var not in self.levels:
+                yield from walk(current, position + 1, index << 1)
+                yield from walk(current, position + 1, index << 1 | 1)
+                return
+            yield from walk(self.restrict(current, var, 0), position + 1, index << 1)
+            yield from walk(self.restrict(current, var, 1), position + 1, index << 1 | 1)
+
+        yield from walk(node, 0, 0)
+
+    def iter_maxterms(self, node, variables):
+        yield from self.iter_minterms(self.negate(node), variables)
+
+    def iter_models(self, node):
+        # Частичные наборы - пути к терминалу 1, без раскрытия пропущенных переменных
+        def walk(current, assignment):
+            if current == self.FALSE:
+                return
+            if current == self.TRUE:
+                yield dict(assignment)
+                return
+            var = self.order[self._level[current]]
+            for value, child in ((False, self._low[current]), (True, self._high[current])):
+                assignment.append((var, value))
+                yield from walk(child, assignment)
+                assignment.pop()
+
+        yield from walk(node, [])
+
+    def iter_cover(self, node):
+        # Неизбыточная ДНФ (Минато-Морреале): кубы - частичные наборы, как
+        # в iter_models, но пересекающиеся, и их обычно намного меньше путей
+        def walk(lower, upper, assignment):
+            if lower == self.FALSE:
+                return
+            if upper == self.TRUE:
+                yield dict(assignment)
+                return
+            level, parts = self._cover_cache[lower, upper][1:]
+            for value, part in zip((False, True, None), parts):
+                if value is not None:
+                    assignment.append((self.order[level], value))
+                yield from walk(*part, assignment)
+                if value is not None:
+                    assignment.pop()
+
+        self._cover(node, node)
+        yield from walk(node, node, [])
+
+    def _cover(self, lower, upper):
+        # Диаграмма покрытия функции между lower и upper. В кеше для каждой
+        # пары хранятся только уровень и три подзадачи: кубы с литералом
+        # 0 и 1 переменной уровня и общие, сами кубы перечисляет iter_cover
+        if lower == self.FALSE:
+            return self.FALSE
+        if upper == self.TRUE:
+            return self.TRUE
+        key = (lower, upper)
+        entry = self._cover_cache.get(key)
+        if entry is None:
+            level = min(self.level(lower), self.level(upper))
+            lower0, lower1 = self._cofactors(lower, level)
+            upper0, upper1 = self._cofactors(upper, level)
+            part0 = (self.ite(upper1, self.FALSE, lower0), upper0)
+            part1 = (self.ite(upper0, self.FALSE, lower1), upper1)
+            cover0, cover1 = self._cover(*part0), self._cover(*part1)
+            rest = (self.ite(self.ite(cover0, self.FALSE, lower0), self.TRUE,
+                             self.ite(cover1, self.FALSE, lower1)),
+                    self.ite(upper0, upper1, self.FALSE))
+            cover = self._cover(*rest)
+            entry = (self._make(level, self.ite(cover0, self.TRUE, cover), self.ite(cover1, self.TRUE, cover)),
+                     level, (part0, part1, rest))
+            self._cover_cache[key] = entry
+        return entry[0]
+
+    def __len__(self):
+        return len(self._level)
+
+
+def formulas_equivalent(first, second, order=None):
+    bdd = BDD(order)
+    return bdd.equivalent(bdd.from_formula(first), bdd.from_formula(second))
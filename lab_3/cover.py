@@ -0,0 +1,136 @@
+import time
+
+
+def iter_bits(bits):
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class CoverSolver:
+    # Минимальное покрытие столбцов строками; строка и множество столбцов -
+    # целые битовые маски. Сначала обязательные строки и отбрасывание
+    # доминируемых строк и столбцов, затем ветви и границы; если время
+    # вышло - лучшее найденное решение, не хуже жадного
+    TIME_BUDGET = 1.0
+
+    def __init__(self, rows, columns=None, time_budget=TIME_BUDGET):
+        self.rows = list(rows)
+        self.columns = columns
+        if self.columns is None:
+            self.columns = 0
+            for row in self.rows:
+                self.columns |= row
+        self.time_budget = time_budget
+        self.optimal = True
+        self._column_rows = {}
+        self._best = []
+        self._deadline = 0
+
+    def solve(self):
+        # Номера выбранных строк по возрастанию; None - столбцы не покрываются
+        covered = 0
+        for row in self.rows:
+            covered |= row
+        if self.columns & ~covered:
+            return None
+        self._deadline = time.monotonic() + self.time_budget
+        self._column_rows = {column: 0 for column in iter_bits(self.columns)}
+        for index, row in enumerate(self.rows):
+            for column in iter_bits(row & self.columns):
+                self._column_rows[column] |= 1 << index
+        chosen, active, universe = self._reduce((1 << len(self.rows)) - 1, self.columns)
+        self._best = self.greedy(active, universe)
+        try:
+            self._search([], active, universe)
+        except TimeoutError:
+            self.optimal = False
+        return sorted(chosen + self._best)
+
+    def greedy(self, active, universe):
+        chosen = []
+        while universe:
+            best_index, best_count = None, 0
+            for index in iter_bits(active):
+                count = (self.rows[index] & universe).bit_count()
+                if count > best_count:
+                    best_index, best_count = index, count
+            chosen.append(best_index)
+            active &= ~(1 << best_index)
+            universe &= ~self.rows[best_index]
+        return chosen
+
+    def _reduce(self, active, universe):
+        chosen = []
+        changed = True
+        while changed and universe:
+            changed = False
+            for column in iter_bits(universe):
+                candidates = self._column_rows[column] & active
+                if candidates.bit_count() == 1 and universe >> column & 1:
+                    index = candidates.bit_length() - 1
+                    chosen.append(index)
+                    active &= ~candidates
+                    universe &= ~self.rows[index]
+                    changed = True
+            if time.monotonic() > self._deadline:
+                break
+            indices = list(iter_bits(active))
+            for index in indices:
+                if time.monotonic() > self._deadline:
+                    # Частичное сокращение допустимо, дальше - жадное решение
+                    return chosen, active, universe
+                row = self.rows[index] & universe
+                for other in indices:
+                    if other == index or not active >> other & 1:
+                        continue
+                    other_row = self.rows[other] & universe
+                    if not row & ~other_row and (row != other_row or other < index):
+                        active &= ~(1 << index)
+                        changed = True
+                        break
+            signatures = {}
+            for column in iter_bits(universe):
+                signatures.setdefault(self._column_rows[column] & active, []).append(column)
+            for candidates in list(signatures):
+                if time.monotonic() > self._deadline:
+                    return chosen, active, universe
+                for other in signatures:
+                    if other != candidates and not other & ~candidates:
+                        # Любая строка столбца other покрывает и эти столбцы
+                        for column in signatures[candidates]:
+                            universe &= ~(1 << column)
+                        changed = True
+                        break
+            if time.monotonic() > self._deadline:
+                break
+        return chosen, active, universe
+
+    def _lower_bound(self, active, universe):
+        bound = 0
+        used = 0
+        for column in iter_bits(universe):
+            candidates = self._column_rows[column] & active
+            if not candidates & used:
+                bound += 1
+                used |= candidates
+        return bound
+
+    def _search(self, chosen, active, universe):
+        if time.monotonic() > self._deadline:
+            raise TimeoutError
+        if not universe:
+            if len(chosen) < len(self._best):
+                self._best = list(chosen)
+            return
+        if len(chosen) + self._lower_bound(active, universe) >= len(self._best):
+            return
+        column = min(iter_bits(universe), key=lambda c: (self._column_rows[c] & active).bit_count())
+        candidates = sorted(iter_bits(self._column_rows[column] & active),
+                            key=lambda index: (-(self.rows[index] & universe).bit_count(), index))
+        for index in candidates:
+            chosen.append(index)
+            self._search(chosen, active & ~(1 << index), universe & ~self.rows[index])
+            chosen.pop()
+            active &= ~(1 << index)
@@ -0,0 +1,450 @@
+from formula import Formula
+from cover import iter_bits
+from minimize_cnf_calculative import ConjunctiveNormalFormReducer
+from minimize_dnf_calculative import DNFMinimizer
+
+
+class EspressoMinimizer:
+    # Эвристическая минимизация в духе Espresso-II: циклы EXPAND,
+    # IRREDUNDANT, REDUCE над списком кубов. Куб - целое число, на каждую
+    # переменную два бита: 01 - переменная равна 0, 10 - равна 1, 11 - любая.
+    # Первая переменная - старшие биты. Для КНФ минимизируется множество нулей.
+    # Множество нулей не строится: куб допустим, если его покрывают исходные
+    # кубы единиц и безразличные наборы, что проверяется тавтологией.
+    # Когда в кофакторе остаётся не больше TABLE_VARIABLES переменных,
+    # тавтология и REDUCE считаются по упакованной таблице истинности
+    DNF = "dnf"
+    CNF = "cnf"
+    TABLE_VARIABLES = 12
+    AST_LIMIT = 4096
+    # Значение операции через значения операндов: (оператор, значение) -
+    # термы объединения, терм - пересечение (номер операнда, его значение)
+    COVER_RULES = {
+        ('!', True): (((0, False),),),
+        ('!', False): (((0, True),),),
+        ('&', True): (((0, True), (1, True)),),
+        ('&', False): (((0, False),), ((1, False),)),
+        ('|', True): (((0, True),), ((1, True),)),
+        ('|', False): (((0, False), (1, False)),),
+        ('->', True): (((0, False),), ((1, True),)),
+        ('->', False): (((0, True), (1, False)),),
+        ('~', True): (((0, True), (1, True)), ((0, False), (1, False))),
+        ('~', False): (((0, True), (1, False)), ((0, False), (1, True))),
+    }
+
+    def __init__(self, variables, on_set, dont_cares=(), form=DNF):
+        self.variables = list(variables)
+        self.form = form
+        count = len(self.variables)
+        self.full = (1 << 2 * count) - 1
+        self.low = self.full // 3
+        self.dont_cares = [cube for cube in dont_cares if not self._is_empty(cube)]
+        self.on_set = list(dict.fromkeys(cube for cube in on_set if not self._is_empty(cube)))
+        self.care_set = self.on_set + self.dont_cares
+        self.cover = []
+        self._tautologies = {}
+        self._masks = {}
+
+    @classmethod
+    def from_terms(cls, terms, variables=None, form=DNF):
+        # Термы - наборы литералов вида 'a' и '¬a', как в остальных минимизаторах
+        terms = [set(term) for term in terms]
+        if variables is None:
+            variables = sorted({literal.lstrip('¬') for term in terms for literal in term})
+        return cls(variables, [cls.encode(variables, term) for term in terms], form=form)
+
+    @classmethod
+    def from_dnf(cls, expression, variables=None):
+        return cls.from_terms(DNFMinimizer.parse_expression(expression), variables)
+
+    @classmethod
+    def from_cnf(cls, expression, variables=None):
+        # Дизъюнкт ложен ровно на наборе из отрицаний его литералов
+        clauses = ConjunctiveNormalFormReducer._process_input(expression)
+        zeros = [{cls._negate(literal) for literal in clause} for clause in clauses]
+        return cls.from_terms(zeros, variables, form=cls.CNF)
+
+    @classmethod
+    def from_formula(cls, formula, form=DNF):
+        # Начальное покрытие строится по дереву разбора, без таблицы истинности.
+        # Если пересечений кубов слишком много, оно берётся из неизбыточной
+        # ДНФ по диаграмме решений (по её отрицанию для КНФ)
+        variables = formula.get_variables()
+        cubes = cls._ast_cover(variables, formula.get_ast(), form == cls.DNF)
+        if cubes is None:
+            bdd, node = formula.get_bdd()
+            if form == cls.CNF:
+                node = bdd.negate(node)
+            cubes = [cls._encode_model(variables, model) for model in bdd.iter_cover(node)]
+        return cls(variables, cubes, form=form)
+
+    @classmethod
+    def _ast_cover(cls, variables, root, value):
+        # Кубы, на которых узел равен value: по COVER_RULES это объединение
+        # попарных пересечений кубов операндов. Для каждого узла считаются
+        # только нужные значения. None - пересечений больше AST_LIMIT
+        full = (1 << 2 * len(variables)) - 1
+        low = full // 3
+        nodes = list(root.iter_nodes())
+        needed = {root: {value}}
+        for node in reversed(nodes):
+            for wanted in needed.get(node, ()):
+                for term in cls.COVER_RULES.get((node.operator, wanted), ()):
+                    for index, operand_value in term:
+                        needed.setdefault(node.children[index], set()).add(operand_value)
+        covers = {}
+        for node in nodes:
+            for wanted in needed.get(node, ()):
+                if node.is_variable:
+                    literal = node.name if wanted else f'¬{node.name}'
+                    covers[node, wanted] = [cls.encode(variables, [literal])]
+                    continue
+                cubes = []
+                for term in cls.COVER_RULES[node.operator, wanted]:
+                    product = [full]
+                    for index, operand_value in term:
+                        operand = covers[node.children[index], operand_value]
+                        if len(product) * len(operand) > cls.AST_LIMIT:
+                            return None
+                        product = [cube for cube in (first & second for first in product for second in operand)
+                                   if (cube | cube >> 1) & low == low]
+                    cubes.extend(product)
+                if len(cubes) > cls.AST_LIMIT:
+                    return None
+                covers[node, wanted] = list(dict.fromkeys(cubes))
+        return covers[root, value]
+
+    @classmethod
+    def from_table_file(cls, path, form=DNF):
+        return cls.from_formula(Formula.from_table_file(path), form)
+
+    @staticmethod
+    def _negate(literal):
+        return literal[1:] if literal.startswith('¬') else f'¬{literal}'
+
+    @staticmethod
+    def encode(variables, term):
+        shifts = {var: 2 * (len(variables) - position - 1) for position, var in enumerate(variables)}
+        cube = (1 << 2 * len(variables)) - 1
+        for literal in term:
+            negated = literal.startswith('¬')
+            var = literal[1:] if negated else literal
+            if var not in shifts:
+                raise ValueError(f"Не указаны переменные: {{'{var}'}}")
+            cube &= ~((0b10 if negated else 0b01) << shifts[var])
+        return cube
+
+    @classmethod
+    def _encode_model(cls, variables, model):
+        return cls.encode(variables, [var if value else f'¬{var}' for var, value in model.items()])
+
+    def decode(self, cube):
+        term = set()
+        for position, var in enumerate(self.variables):
+            field = cube >> 2 * (len(self.variables) - position - 1) & 0b11
+            if field == 0b10:
+                term.add(var)
+            elif field == 0b01:
+                term.add(f'¬{var}')
+        return term
+
+    def _is_empty(self, cube):
+        return (cube | cube >> 1) & self.low != self.low
+
+    def _literals(self, cube):
+        # Младшие биты полей переменных, входящих в куб
+        return ~(cube & cube >> 1) & self.low
+
+    def _free_count(self, cube):
+        return (cube & cube >> 1 & self.low).bit_count()
+
+    def _cost(self, cubes):
+        return len(cubes), sum(self._literals(cube).bit_count() for cube in cubes)
+
+    def _cofactor(self, cubes, cube):
+        rest = ~cube & self.full
+        low = self.low
+        result = []
+        for other in cubes:
+            common = other & cube
+            if (common | common >> 1) & low == low:
+                result.append(other | rest)
+        return result
+
+    def _split_variable(self, cubes, binate):
+        # Младший бит поля той из переменных binate, что входит в наибольшее
+        # число кубов. Счётчики разрядные: counters[k] - k-й бит счётчика
+        # каждого поля, добавление куба - перенос по уровням, как в сумматоре
+        counters = []
+        for cube in cubes:
+            carry = ~(cube & cube >> 1) & binate
+            for level, counter in enumerate(counters):
+                if not carry:
+                    break
+                counters[level], carry = counter ^ carry, counter & carry
+            if carry:
+                counters.append(carry)
+        best = binate
+        for counter in reversed(counters):
+            if best & counter:
+                best &= counter
+        return best.bit_length() - 1
+
+    def _halves(self, shift):
+        return self.full & ~(0b10 << shift), self.full & ~(0b01 << shift)
+
+    def _tautology(self, cubes):
+        # Одни и те же кофакторы проверяются снова и снова: циклы EXPAND и
+        # REDUCE часто возвращаются к тем же кубам. Кешируются только
+        # проверки верхнего уровня, иначе кеш растёт слишком быстро
+        key = tuple(cubes)
+        result = self._tautologies.get(key)
+        if result is None:
+            result = self._tautologies[key] = self._check_tautology(cubes)
+        return result
+
+    def _check_tautology(self, cubes):
+        low = self.low
+        space = 1 << len(self.variables)
+        while True:
+            if self.full in cubes:
+                return True
+            negative = positive = total = 0
+            for cube in cubes:
+                negative |= cube & ~(cube >> 1) & low
+                positive |= cube >> 1 & ~cube & low
+                total += 1 << (cube & cube >> 1 & low).bit_count()
+            # Объём меньше пространства - кубы заведомо не покрывают его
+            if total < space:
+                return False
+            # Переменная одной полярности: покрытие - тавтология, только
+            # если тавтология его часть без этой переменной
+            unate = negative ^ positive
+            if not unate:
+                break
+            cubes = [cube for cube in cubes if not ~(cube & cube >> 1) & unate]
+        binate = negative & positive
+        if binate.bit_count() <= self.TABLE_VARIABLES:
+            return not self._uncovered_table(cubes, binate)[1]
+        shift = self._split_variable(cubes, binate)
+        # Объёмы половин без построения кофакторов: кубы с литералом той же
+        # полярности удваиваются, с противоположной - выпадают
+        zero = one = 0
+        for cube in cubes:
+            field = cube >> shift & 0b11
+            if field == 0b01:
+                zero += 1 << (cube & cube >> 1 & low).bit_count()
+            elif field == 0b10:
+                one += 1 << (cube & cube >> 1 & low).bit_count()
+        if total + zero - one < space or total + one - zero < space:
+            return False
+        # Сначала половина с меньшим объёмом: она чаще не покрыта
+        halves = self._halves(shift)
+        if one < zero:
+            halves = halves[::-1]
+        return all(self._check_tautology(self._cofactor(cubes, half)) for half in halves)
+
+    def _uncovered_table(self, cubes, active):
+        # Переменных с литералами осталось мало: наборы, не покрытые кубами,
+        # собираются в упакованную таблицу истинности над этими переменными.
+        # Маски переменных - по младшим битам их полей
+        positions = list(iter_bits(active))
+        count = len(positions)
+        if count not in self._masks:
+            self._masks[count] = Formula.get_variable_masks(list(range(count)))
+        masks, full = self._masks[count]
+        masks = {bit: masks[index] for index, bit in enumerate(positions)}
+        covered = 0
+        for cube in cubes:
+            row = full
+            for bit in iter_bits(~(cube & cube >> 1) & active):
+                row &= masks[bit] if cube >> bit & 0b10 else ~masks[bit]
+            covered |= row
+            if covered == full:
+                break
+        return masks, full & ~covered
+
+    def _table_supercube(self, cubes, active):
+        masks, uncovered = self._uncovered_table(cubes, active)
+        if not uncovered:
+            return 0
+        result = self.full
+        for bit, mask in masks.items():
+            if not uncovered & mask:
+                result &= ~(0b10 << bit)
+            elif not uncovered & ~mask:
+                result &= ~(0b01 << bit)
+        return result
+
+    def covers(self, cubes, cube):
+        return self._tautology(self._cofactor(cubes, cube))
+
+    def expand(self, cubes):
+        # Каждый куб расширяется до простой импликанты: переменные снимаются
+        # по одной, пока куб покрыт единицами и безразличными наборами.
+        # Первыми снимаются переменные, мешающие накрыть больше других кубов.
+        # Кубы, попавшие в уже найденную импликанту, не расширяются, поэтому
+        # результат без поглощений
+        order = sorted(cubes, key=lambda cube: (-self._free_count(cube), cube))
+        covered = set()
+        result = []
+        for cube in order:
+            if cube in covered:
+                continue
+            counts = {}
+            for other in order:
+                if other not in covered:
+                    difference = other & ~cube
+                    for bit in iter_bits((difference | difference >> 1) & self.low):
+                        counts[bit] = counts.get(bit, 0) + 1
+            near = self._near(self.care_set, cube)
+            for bit in sorted(iter_bits(self._literals(cube)), key=lambda bit: (-counts.get(bit, 0), bit)):
+                # Сам куб уже покрыт, проверяется только его отражение по переменной
+                if self.covers(near, cube ^ 0b11 << bit):
+                    cube |= 0b11 << bit
+                    near = self._near(self.care_set, cube)
+            result.append(cube)
+            covered.update(other for other in order if not other & ~cube)
+        return result
+
+    def _near(self, cubes, cube):
+        # Кубы, расходящиеся с cube не более чем по одной переменной: только
+        # они могут пересечь куб, у которого снята ещё одна переменная
+        low = self.low
+        result = []
+        for other in cubes:
+            common = other & cube
+            if (~(common | common >> 1) & low).bit_count() <= 1:
+                result.append(other)
+        return result
+
+    def irredundant(self, cubes):
+        kept = sorted(cubes, key=lambda cube: (-self._free_count(cube), cube))
+        for cube in sorted(kept, key=lambda cube: (self._free_count(cube), cube)):
+            rest = [other for other in kept if other != cube]
+            if self.covers(rest + self.dont_cares, cube):
+                kept = rest
+        return kept
+
+    def reduce(self, cubes):
+        # Куб сужается до наименьшего куба, содержащего его наборы,
+        # не покрытые остальными кубами
+        result = sorted(cubes, key=lambda cube: (-self._free_count(cube), cube))
+        index = 0
+        while index < len(result):
+            cube = self._reduce_cube(result[index], result[:index] + result[index + 1:] + self.dont_cares)
+            if cube is None:
+                del result[index]
+                continue
+            result[index] = cube
+            index += 1
+        return result
+
+    def _reduce_cube(self, cube, rest):
+        # None - куб целиком покрыт остальными. Объём половины: кубы с
+        # литералом той же полярности удваиваются, с противоположной -
+        # выпадают. Если он меньше пространства, в половине есть непокрытые
+        # наборы и значение переменной сразу входит в ответ, а с ним и
+        # переменные, которых нет в кубах
+        local = self._cofactor(rest, cube)
+        total = 0
+        shifts = {}
+        for other in local:
+            volume = 1 << self._free_count(other)
+            total += volume
+            for bit in iter_bits(self._literals(other)):
+                shifts[bit] = shifts.get(bit, 0) + (-volume if other >> bit & 1 else volume)
+        space = 1 << len(self.variables)
+        found = 0
+        for bit, shift in shifts.items():
+            if total + shift < space:
+                found |= 0b10 << bit
+            if total - shift < space:
+                found |= 0b01 << bit
+        if found or total < space:
+            found |= (self.low & ~sum(1 << bit for bit in shifts)) * 0b11
+        uncovered = self._uncovered_supercube(local, self.full, found)
+        return cube & uncovered if uncovered else None
+
+    def _uncovered_supercube(self, cubes, region, found):
+        # found, расширенный до наименьшего куба, содержащего ещё и наборы
+        # области region, не покрытые кубами. Область - куб из переменных,
+        # по которым уже делили; если она не добавит к found ни одного бита,
+        # дальше делить незачем. Когда переменных с литералами остаётся
+        # мало, непокрытые наборы берутся из таблицы
+        if found | region == found or self.full in cubes:
+            return found
+        low = self.low
+        negative = positive = 0
+        for cube in cubes:
+            negative |= cube & ~(cube >> 1) & low
+            positive |= cube >> 1 & ~cube & low
+        # Переменная одной полярности: без кубов с её литералом непокрытых
+        # наборов не меньше, и по остальным переменным ответ даёт эта часть.
+        # Значение литерала входит в ответ, если не покрыта его половина
+        unate = negative ^ positive
+        if unate:
+            literals = [((0b10 if positive >> bit & 1 else 0b01) << bit, self._halves(bit)) for bit in iter_bits(unate)]
+            within = region
+            for literal, (zero, one) in literals:
+                within &= one if literal & zero else zero
+            found = self._uncovered_supercube([cube for cube in cubes if not ~(cube & cube >> 1) & unate],
+                                              within, found)
+            for literal, (zero, one) in literals:
+                if not found & literal and not self._tautology(self._cofactor(cubes, zero if literal & zero else one)):
+                    found |= literal
+            return found
+        if negative.bit_count() <= self.TABLE_VARIABLES:
+            return found | self._table_supercube(cubes, negative) & region
+        shift = self._split_variable(cubes, negative)
+        for half in self._halves(shift):
+            found = self._uncovered_supercube(self._cofactor(cubes, half), region & half, found)
+        return found
+
+    def last_gasp(self, cubes):
+        # Каждый куб сужается независимо от остальных; простые импликанты,
+        # покрывающие сразу два суженных куба, добавляются к покрытию
+        reduced = []
+        for index, cube in enumerate(cubes):
+            smaller = self._reduce_cube(cube, cubes[:index] + cubes[index + 1:] + self.dont_cares)
+            if smaller is not None and smaller != cube:
+                reduced.append(smaller)
+        primes = [prime for prime in self.expand(reduced)
+                  if sum(not cube & ~prime for cube in reduced) > 1]
+        return self.irredundant(cubes + [prime for prime in primes if prime not in cubes])
+
+    def minimize(self):
+        cover = self.irredundant(self.expand(self.on_set))
+        while cover:
+            candidate = self.irredundant(self.expand(self.reduce(cover)))
+            if self._cost(candidate) >= self._cost(cover):
+                candidate = self.last_gasp(cover)
+                if self._cost(candidate) >= self._cost(cover):
+                    break
+            cover = candidate
+        self.cover = cover
+        self._tautologies.clear()
+        return self.format_cover(cover)
+
+    def format_cover(self, cubes):
+        terms = [self.decode(cube) for cube in sorted(cubes, reverse=True)]
+        if self.form == self.CNF:
+            if not terms:
+                return "True"
+            clauses = [sorted(self._negate(literal) for literal in term) for term in terms]
+            if not all(clauses):
+                return "False"
+            return " ∧ ".join(f"({' ∨ '.join(clause)})" for clause in clauses)
+        return DNFMinimizer.format_expression(terms)
+
+
+def main():
+    expression = '!(a→(b∧!c))'
+    formula = Formula(expression)
+    print(f"Логическое выражение: {expression}")
+    print("Минимизированная ДНФ:", EspressoMinimizer.from_formula(formula).minimize())
+    print("Минимизированная КНФ:", EspressoMinimizer.from_formula(formula, EspressoMinimizer.CNF).minimize())
+
+
+if __name__ == "__main__":
+    main()
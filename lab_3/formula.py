@@ -1,11 +1,105 @@
+import io
+import os
 import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from itertools import product
+from multiprocessing import shared_memory
+from bdd import BDD
+from formula_ast import Parser
+from sat import CDCLSolver, TseitinEncoder
+from table_file import TruthTableFile
+
+try:
+    from vectorized import VectorizedTable, popcounts, unpack_values, walsh_hadamard
+except ImportError:
+    VectorizedTable = None
+
+
+class TruthTable:
+    # Упакованная таблица истинности: бит i вектора - значение функции
+    # в i-й строке, строки упорядочены по переменным variables
+    BYTE_ONES = [[bit for bit in range(8) if byte >> bit & 1] for byte in range(256)]
+
+    def __init__(self, variables, vector):
+        self.variables = list(variables)
+        self.vector = vector
+        self.size = 1 << len(self.variables)
+
+    @classmethod
+    def from_bytes(cls, variables, data):
+        return cls(variables, int.from_bytes(data, 'little'))
+
+    def to_bytes(self):
+        return self.vector.to_bytes((self.size + 7) // 8, 'little')
+
+    def iter_values(self):
+        bits = format(self.vector, f'0{self.size}b')
+        for index in range(self.size - 1, -1, -1):
+            yield bits[index] == '1'
+
+    def index_to_values(self, index):
+        count = len(self.variables)
+        return [bool(index >> (count - position - 1) & 1) for position in range(count)]
+
+    def get_rows(self):
+        combinations = product([False, True], repeat=len(self.variables))
+        return [list(values) + [result] for values, result in zip(combinations, self.iter_values())]
+
+    def iter_minterms(self):
+        for offset, byte in enumerate(self.to_bytes()):
+            for bit in self.BYTE_ONES[byte]:
+                yield offset * 8 + bit
+
+    def iter_maxterms(self):
+        for offset, byte in enumerate(self.to_bytes()):
+            for bit in self.BYTE_ONES[byte ^ 0xFF]:
+                index = offset * 8 + bit
+                if index >= self.size:
+                    return
+                yield index
+
+    def minterms(self):
+        return list(self.iter_minterms())
+
+    def maxterms(self):
+        return list(self.iter_maxterms())
+
+    def get_index_form(self):
+        result_string = format(self.vector, f'0{self.size}b')[::-1]
+        return result_string, int(result_string, 2)
 
 
 class Formula:
     MAX_BITS = 7
-
-    def __init__(self, formula):
+    PARALLEL_THRESHOLD = 24
+    EQUIVALENCE_TABLE_LIMIT = 20
+    POST_CLASSES = ("T0", "T1", "S", "M", "L")
+    BITWISE = "bitwise"
+    NUMPY = "numpy"
+    SHARDS_PER_WORKER = 4
+    BOOLEAN_TEMPLATES = {
+        "!": "not {0}",
+        "&": "{0} and {1}",
+        "|": "{0} or {1}",
+        "->": "not {0} or {1}",
+        "~": "{0} == {1}",
+    }
+    BITWISE_TEMPLATES = {
+        "!": "full ^ {0}",
+        "&": "{0} & {1}",
+        "|": "{0} | {1}",
+        "->": "full ^ {0} | {1}",
+        "~": "full ^ {0} ^ {1}",
+    }
+    def __init__(self, formula, backend=BITWISE):
+        if backend not in (self.BITWISE, self.NUMPY):
+            raise ValueError(f"Неизвестный способ вычисления: {backend}")
+        if backend == self.NUMPY and VectorizedTable is None:
+            raise ImportError("Для вычисления через NumPy требуется пакет numpy")
+        self.backend = backend
         self.operators = {
             "!": {"priority": 4, "unary": True},
             "&": {"priority": 3, "unary": False},
@@ -16,6 +110,36 @@ class Formula:
         self.expression = formula.replace('∨', '|').replace(
             '∧', '&').replace('→', '->').replace('↔', '~')
 
+    @classmethod
+    def interned(cls, formula, backend=BITWISE):
+        # Общий для процесса экземпляр: разбор, скомпилированный код и таблица
+        # истинности переиспользуются; изменять такую формулу нельзя
+        return formula_cache.get(formula, backend)
+
+    @classmethod
+    def from_table_file(cls, path):
+        # Таблица берётся из файла и не пересчитывается
+        with TruthTableFile(path) as table_file:
+            formula = cls(table_file.expression)
+            if formula.get_variables() != table_file.variables:
+                raise ValueError("Переменные файла не совпадают с переменными формулы")
+            with table_file.data() as data:
+                formula._cache["truth_table"] = TruthTable.from_bytes(table_file.variables, data)
+        return formula
+
+    def save_truth_table(self, path, workers=None):
+        truth_table = self.get_truth_table(workers)
+        TruthTableFile.write(path, truth_table.variables, truth_table.to_bytes(), self.expression)
+
+    @property
+    def expression(self):
+        return self._expression
+
+    @expression.setter
+    def expression(self, value):
+        self._expression = value
+        self._cache = {}
+
     @classmethod
     def get_positive_binary_number(cls, decimal_number):
         if decimal_number < 0:
@@ -45,8 +169,11 @@ class Formula:
             return -cls.binary_to_decimal_number(inverted) - 1
         return cls.binary_to_decimal_number(binary_number)
 
+    def get_ast(self):
+        return self._get_cached("ast", lambda: Parser(self.operators).parse(self.expression))
+
     def get_variables(self):
-        return sorted(set(re.findall(r'\b[a-zA-Z]+\b', self.expression)))
+        return self._get_cached("variables", lambda: self.get_ast().get_variables())
 
     def combinations(self):
         variables = self.get_variables()
@@ -54,44 +181,11 @@ class Formula:
             yield dict(zip(variables, combination))
 
     def tokenize(self):
-        tokens = []
-        i = 0
-        while i < len(self.expression):
-            if self.expression[i] == '-' and i + 1 < len(self.expression) and self.expression[i + 1] == '>':
-                tokens.append('->')
-                i += 2
-            elif self.expression[i] in "()!&|~":
-                tokens.append(self.expression[i])
-                i += 1
-            elif self.expression[i].isalpha():
-                var = []
-                while i < len(self.expression) and (self.expression[i].isalpha() or self.expression[i].isdigit()):
-                    var.append(self.expression[i])
-                    i += 1
-                tokens.append(''.join(var))
-            else:
-                i += 1
-        return tokens
+        return [token for token, _ in Parser(self.operators).tokenize(self.expression)]
 
     def to_postfix(self, tokens):
-        output = []
-        stack = []
-        for token in tokens:
-            if token == '(':
-                stack.append(token)
-            elif token == ')':
-                while stack[-1] != '(':
-                    output.append(stack.pop())
-                stack.pop()
-            elif token in self.operators:
-                while stack and stack[-1] != '(' and self.operators[token]["priority"] <= self.operators.get(stack[-1], {"priority": -1})["priority"]:
-                    output.append(stack.pop())
-                stack.append(token)
-            else:
-                output.append(token)
-        while stack:
-            output.append(stack.pop())
-        return output
+        positioned = [(token, position) for position, token in enumerate(tokens)]
+        return Parser(self.operators).parse_tokens(positioned).to_postfix()
 
     def evaluate_postfix(self, postfix, variables):
         stack = []
@@ -117,65 +211,405 @@ class Formula:
                 stack.append(variables[token])
         return stack[0]
 
+    def _get_cached(self, key, factory):
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    def get_postfix(self):
+        return self._get_cached("postfix", lambda: self.get_ast().to_postfix())
+
+    def compile(self, variables=None, bitwise=False):
+        # Разбор выполняется один раз: каждый уникальный узел дерева становится
+        # присваиванием во временную переменную линейного кода
+        if variables is None:
+            variables = self.get_variables()
+        key = ("compiled", tuple(variables), bitwise)
+        return self._get_cached(key, lambda: self._build_evaluator(variables, bitwise))
+
+    def _build_evaluator(self, variables, bitwise):
+        return self.generate_evaluator([self.get_ast()], variables, bitwise, f"<formula {self.expression}>")
+
+    @classmethod
+    def generate_evaluator(cls, roots, variables, bitwise, filename, as_tuple=False):
+        # Общие поддеревья нескольких корней вычисляются один раз
+        arguments = {var: f"v{i}" for i, var in enumerate(variables)}
+        templates = cls.BITWISE_TEMPLATES if bitwise else cls.BOOLEAN_TEMPLATES
+        lines = []
+        names = {}
+        for root in roots:
+            for node in root.iter_nodes():
+                if node in names:
+                    continue
+                if node.is_variable:
+                    if node.name not in arguments:
+                        raise ValueError(f"Не указаны переменные: {{'{node.name}'}}")
+                    names[node] = arguments[node.name]
+                else:
+                    operands = [names[child] for child in node.children]
+                    names[node] = f"t{len(lines)}"
+                    lines.append(f"    {names[node]} = {templates[node.operator].format(*operands)}")
+        parameters = list(arguments.values()) + (["full"] if bitwise else [])
+        results = [names[root] if bitwise else f"bool({names[root]})" for root in roots]
+        result = f"({', '.join(results)},)" if as_tuple else results[0]
+        source = (f"def evaluate({', '.join(parameters)}):\n"
+                  + "".join(line + "\n" for line in lines)
+                  + f"    return {result}\n")
+        namespace = {}
+        exec(compile(source, filename, "exec"), namespace)
+        return namespace["evaluate"]
+
+    def iter_gray_code(self, variables=None):
+        # Наборы перебираются в порядке кода Грея: между соседними строками
+        # меняется одна переменная, и пересчитываются только зависящие от неё узлы
+        if variables is None:
+            variables = self.get_variables()
+        key = ("gray_code", tuple(variables))
+        return self._get_cached(key, lambda: self._build_gray_walker(variables))(1 << len(variables))
+
+    def _build_gray_walker(self, variables):
+        arguments = {var: f"v{i}" for i, var in enumerate(variables)}
+        lines = [f"    {name} = False" for name in arguments.values()]
+        names = {}
+        depends = {}
+        updates = [[] for _ in variables]
+        root = self.get_ast()
+        for node in root.iter_nodes():
+            if node.is_variable:
+                if node.name not in arguments:
+                    raise ValueError(f"Не указаны переменные: {{'{node.name}'}}")
+                names[node] = arguments[node.name]
+                depends[node] = {variables.index(node.name)}
+                continue
+            names[node] = f"t{len(names)}"
+            operands = [names[child] for child in node.children]
+            line = f"{names[node]} = {self.BOOLEAN_TEMPLATES[node.operator].format(*operands)}"
+            lines.append(f"    {line}")
+            depends[node] = set().union(*(depends[child] for child in node.children))
+            for position in depends[node]:
+                updates[position].append(line)
+        lines.append("    index = 0")
+        lines.append(f"    yield index, bool({names[root]})")
+        lines.append("    for step in range(1, size):")
+        for bit in range(len(variables)):
+            position = len(variables) - bit - 1
+            lines.append(f"        {'if' if not bit else 'elif'} step & {1 << bit}:")
+            lines.append(f"            index ^= {1 << bit}")
+            lines.append(f"            v{position} = not v{position}")
+            lines.extend(f"            {line}" for line in updates[position])
+        lines.append(f"        yield index, bool({names[root]})")
+        source = "def walk(size):\n" + "".join(line + "\n" for line in lines)
+        namespace = {}
+        exec(compile(source, f"<formula {self.expression}>", "exec"), namespace)
+        return namespace["walk"]
+
     def evaluate_of_expr(self, **variables):
-        tokens = self.tokenize()
-        missing = set(t for t in tokens if t.isalpha()) - set(variables.keys())
+        names = self.get_variables()
+        missing = set(names) - set(variables.keys())
         if missing:
             raise ValueError(f"Не указаны переменные: {missing}")
-        postfix = self.to_postfix(tokens)
-        return self.evaluate_postfix(postfix, variables)
+        return self.compile(names)(*(variables[name] for name in names))
 
-    def create_table_of_truth(self):
+    @staticmethod
+    def get_variable_masks(variables):
+        # бит i маски - значение переменной в i-й строке таблицы истинности
+        size = 1 << len(variables)
+        full = (1 << size) - 1
+        masks = {}
+        for position, var in enumerate(variables):
+            block = 1 << (len(variables) - position - 1)
+            mask = ((1 << block) - 1) << block
+            width = 2 * block
+            while width < size:
+                mask |= mask << width
+                width *= 2
+            masks[var] = mask
+        return masks, full
+
+    @classmethod
+    def get_shard_masks(cls, variables, start, bits):
+        # Маски для выровненного диапазона из 2^bits строк, начиная со start:
+        # младшие bits переменных меняются, старшие постоянны во всём диапазоне
+        fixed = len(variables) - bits
+        masks, full = cls.get_variable_masks(variables[fixed:])
+        for position, var in enumerate(variables[:fixed]):
+            masks[var] = full if start >> (len(variables) - position - 1) & 1 else 0
+        return masks, full
+
+    def get_truth_table(self, workers=None):
+        return self._get_cached("truth_table", lambda: self._build_truth_table(workers))
+
+    def _build_truth_table(self, workers=None):
         variables = self.get_variables()
-        combinations = list(self.combinations())
-        result_of_expr = []
-        table = []
-        for combo in combinations:
-            result = self.evaluate_of_expr(**combo)
-            result_of_expr.append(result)
-            row = [combo[var] for var in variables] + [result]
-            table.append(row)
-        return table, variables + ["Result"], result_of_expr
+        if self.backend == self.NUMPY:
+            return TruthTable.from_bytes(variables, self.get_vectorized_table().to_bytes())
+        if workers is None:
+            workers = os.cpu_count() if len(variables) >= self.PARALLEL_THRESHOLD else 1
+        if workers > 1 and len(variables) > 3:
+            return self._build_sharded_truth_table(variables, workers)
+        masks, full = self.get_variable_masks(variables)
+        evaluate = self.compile(variables, bitwise=True)
+        return TruthTable(variables, evaluate(*(masks[var] for var in variables), full))
+
+    def _build_sharded_truth_table(self, variables, workers):
+        # Диапазоны строк выровнены по байтам, поэтому процессы пишут
+        # упакованные результаты в общую память без пересечений
+        count = len(variables)
+        shards = min(workers * self.SHARDS_PER_WORKER, 1 << (count - 3))
+        bits = count - (shards - 1).bit_length()
+        shards = 1 << (count - bits)
+        memory = shared_memory.SharedMemory(create=True, size=(1 << count) // 8)
+        try:
+            with ProcessPoolExecutor(workers, initializer=_init_shard_worker,
+                                     initargs=(self.expression, variables, memory.name)) as executor:
+                for _ in executor.map(_evaluate_shard, range(0, 1 << count, 1 << bits),
+                                      [bits] * shards):
+                    pass
+            return TruthTable.from_bytes(variables, memory.buf)
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def get_vectorized_table(self):
+        if VectorizedTable is None:
+            raise ImportError("Для вычисления через NumPy требуется пакет numpy")
+        return self._get_cached("vectorized_table", lambda: VectorizedTable.from_ast(
+            self.get_ast(), self.get_variables()))
+
+    def walsh_spectrum(self):
+        # W(w) = сумма по наборам x значений (-1)^(f(x) xor w·x)
+        if VectorizedTable is None:
+            raise ImportError("Для спектра Уолша требуется пакет numpy")
+        truth_table = self.get_truth_table()
+        return self._get_cached("walsh_spectrum", lambda: walsh_hadamard(
+            unpack_values(truth_table.to_bytes(), truth_table.size)))
+
+    def nonlinearity(self):
+        spectrum = self.walsh_spectrum()
+        return (len(spectrum) - int(abs(spectrum).max())) // 2
+
+    def is_balanced(self):
+        return int(self.walsh_spectrum()[0]) == 0
+
+    def correlation_immunity(self):
+        # Наибольший порядок m: спектр равен нулю на всех w веса от 1 до m
+        spectrum = self.walsh_spectrum()
+        weights = popcounts(len(spectrum))
+        order = 0
+        while order < len(self.get_variables()) and not spectrum[weights == order + 1].any():
+            order += 1
+        return order
+
+    def get_truth_vector(self):
+        return self.get_truth_table().vector
+
+    def create_table_of_truth(self, workers=None):
+        if self.backend == self.NUMPY:
+            table = self.get_vectorized_table()
+            return table.get_rows().tolist(), table.variables + ["Result"], table.values.tolist()
+        truth_table = self.get_truth_table(workers)
+        return (truth_table.get_rows(), truth_table.variables + ["Result"],
+                list(truth_table.iter_values()))
+
+    def iter_cnf_clauses(self):
+        truth_table = self.get_truth_table()
+        for index in truth_table.iter_maxterms():
+            values = truth_table.index_to_values(index)
+            clause = []
+            for i, var in enumerate(truth_table.variables):
+                clause.append(f'¬{var}' if values[i] else var)
+            yield f'({" ∨ ".join(clause)})'
+
+    def iter_dnf_terms(self):
+        truth_table = self.get_truth_table()
+        for index in truth_table.iter_minterms():
+            values = truth_table.index_to_values(index)
+            clause = []
+            for i, var in enumerate(truth_table.variables):
+                clause.append(var if values[i] else f'¬{var}')
+            yield f'({" ∧ ".join(clause)})'
+
+    @staticmethod
+    def _write_terms(fp, terms, separator, empty):
+        count = 0
+        for term in terms:
+            if count:
+                fp.write(separator)
+            fp.write(term)
+            count += 1
+        if not count:
+            fp.write(empty)
+        return count
+
+    def write_cnf(self, fp):
+        return self._write_terms(fp, self.iter_cnf_clauses(), " ∧ ", "True")
+
+    def write_dnf(self, fp):
+        return self._write_terms(fp, self.iter_dnf_terms(), " ∨ ", "False")
 
     def to_cnf(self):
-        table, headers, result_of_expr = self.create_table_of_truth()
-        variables = headers[:-1]
-        cnf = []
-        for row in table:
-            if not row[-1]:
-                clause = []
-                for i, var in enumerate(variables):
-                    clause.append(f'¬{var}' if row[i] else var)
-                cnf.append(f'({" ∨ ".join(clause)})')
-        return " ∧ ".join(cnf) if cnf else "True"
+        cnf = " ∧ ".join(self.iter_cnf_clauses())
+        return cnf if cnf else "True"
 
     def to_dnf(self):
-        table, headers, result_of_expr = self.create_table_of_truth()
-        variables = headers[:-1]
-        dnf = []
-        for row in table:
-            if row[-1]:
-                clause = []
-                for i, var in enumerate(variables):
-                    clause.append(var if row[i] else f'¬{var}')
-                dnf.append(f'({" ∧ ".join(clause)})')
-        return " ∨ ".join(dnf) if dnf else "False"
+        dnf = " ∨ ".join(self.iter_dnf_terms())
+        return dnf if dnf else "False"
 
     def get_number_forms(self):
-        table, headers, result_of_expr = self.create_table_of_truth()
-        variables = headers[:-1]
-        disjunction = []
-        conjunction = []
-        for row in table:
-            binary = ''.join(str(int(v)) for v in row[:-1])
-            decimal = self.binary_to_decimal_number(binary)
-            if row[-1]:
-                disjunction.append(decimal)
-            else:
-                conjunction.append(decimal)
+        if self.backend == self.NUMPY:
+            table = self.get_vectorized_table()
+            disjunction = table.minterms().tolist()
+            conjunction = table.maxterms().tolist()
+        else:
+            truth_table = self.get_truth_table()
+            disjunction = truth_table.minterms()
+            conjunction = truth_table.maxterms()
         return (f"({','.join(map(str, disjunction))}) ∨\n"
                 f"({','.join(map(str, conjunction))}) ∧")
 
+    def get_index_form(self):
+        return self.get_truth_table().get_index_form()
+
+    def get_bdd(self):
+        return self._get_cached("bdd", self._build_bdd)
+
+    def _build_bdd(self):
+        bdd = BDD(self.get_variables())
+        return bdd, bdd.from_formula(self)
+
+    def count_models(self):
+        bdd, node = self.get_bdd()
+        return bdd.count_models(node, self.get_variables())
+
+    def is_satisfiable(self):
+        bdd, node = self.get_bdd()
+        return bdd.is_satisfiable(node)
+
+    def is_tautology(self):
+        bdd, node = self.get_bdd()
+        return bdd.is_tautology(node)
+
+    def write_tseitin_cnf(self, fp):
+        return TseitinEncoder(self).write_dimacs(fp)
+
+    def to_tseitin_cnf(self):
+        buffer = io.StringIO()
+        self.write_tseitin_cnf(buffer)
+        return buffer.getvalue()
+
+    def find_model(self):
+        encoder = TseitinEncoder(self)
+        model = CDCLSolver(encoder.num_vars, encoder.iter_clauses()).solve()
+        return None if model is None else encoder.decode(model)
+
+    def find_minimal_model(self):
+        # Наименьший в порядке таблицы истинности набор: переменные по очереди
+        # фиксируются в 0, если формула при этом остаётся выполнимой
+        encoder = TseitinEncoder(self)
+        clauses = list(encoder.iter_clauses())
+        model = CDCLSolver(encoder.num_vars, clauses).solve()
+        if model is None:
+            return None
+        for name in encoder.names:
+            literal = encoder.variables[name]
+            if model[literal]:
+                candidate = CDCLSolver(encoder.num_vars, clauses + [(-literal,)]).solve()
+                if candidate is None:
+                    clauses.append((literal,))
+                    continue
+                model = candidate
+            clauses.append((-literal,))
+        return encoder.decode(model)
+
+    def equivalent(self, other):
+        return self._find_counterexample(other, "~")
+
+    def implies(self, other):
+        return self._find_counterexample(other, "->")
+
+    def _find_counterexample(self, other, operator):
+        # Возвращает (True, None) или (False, наименьший набор, на котором
+        # нарушается отношение); переменные обеих формул объединяются
+        variables = sorted(set(self.get_variables()) | set(other.get_variables()))
+        if len(variables) > self.EQUIVALENCE_TABLE_LIMIT:
+            model = Formula(f"!(({self.expression}) {operator} ({other.expression}))").find_minimal_model()
+            return model is None, model
+        masks, full = self.get_variable_masks(variables)
+        arguments = [masks[var] for var in variables] + [full]
+        first = self.compile(variables, bitwise=True)(*arguments)
+        second = other.compile(variables, bitwise=True)(*arguments)
+        difference = first ^ second if operator == "~" else first & (full ^ second)
+        if not difference:
+            return True, None
+        index = (difference & -difference).bit_length() - 1
+        return False, dict(zip(variables, TruthTable(variables, 0).index_to_values(index)))
+
+    def get_zhegalkin_vector(self):
+        # Быстрое преобразование Мёбиуса: бит i результата - коэффициент
+        # при конъюнкции переменных, единичных в наборе i
+        return self._get_cached("zhegalkin", self._build_zhegalkin_vector)
+
+    def _build_zhegalkin_vector(self):
+        truth_table = self.get_truth_table()
+        variables = truth_table.variables
+        masks, full = self.get_variable_masks(variables)
+        vector = truth_table.vector
+        for position, var in enumerate(variables):
+            block = 1 << (len(variables) - position - 1)
+            vector ^= (vector & (full ^ masks[var])) << block
+        return vector
+
+    def to_zhegalkin(self):
+        variables = self.get_variables()
+        monomials = []
+        for index in TruthTable(variables, self.get_zhegalkin_vector()).iter_minterms():
+            monomials.append([var for position, var in enumerate(variables)
+                              if index >> (len(variables) - position - 1) & 1])
+        positions = {var: i for i, var in enumerate(variables)}
+        monomials.sort(key=lambda monomial: (len(monomial), [positions[var] for var in monomial]))
+        terms = []
+        for monomial in monomials:
+            if not monomial:
+                terms.append("1")
+            elif len(monomial) == 1:
+                terms.append(monomial[0])
+            else:
+                terms.append(f"({' ∧ '.join(monomial)})")
+        return " ⊕ ".join(terms) if terms else "0"
+
+    def post_classes(self):
+        # Замкнутые классы Поста проверяются сдвигами и масками целого вектора:
+        # для каждой переменной сравниваются половины таблицы, где она 0 и 1
+        truth_table = self.get_truth_table()
+        variables = truth_table.variables
+        masks, full = self.get_variable_masks(variables)
+        vector = truth_table.vector
+        reversed_vector = vector
+        monotone = True
+        linear_mask = 1
+        for position, var in enumerate(variables):
+            block = 1 << (len(variables) - position - 1)
+            low = vector & (full ^ masks[var])
+            high = (vector & masks[var]) >> block
+            monotone = monotone and not low & (full ^ high)
+            reversed_vector = ((reversed_vector & masks[var]) >> block |
+                               (reversed_vector & (full ^ masks[var])) << block)
+            linear_mask |= 1 << block
+        return {
+            "T0": not vector & 1,
+            "T1": bool(vector >> (truth_table.size - 1) & 1),
+            "S": reversed_vector == full ^ vector,
+            "M": monotone,
+            "L": not self.get_zhegalkin_vector() & (full ^ linear_mask),
+        }
+
+    @staticmethod
+    def is_functionally_complete(formulas):
+        # Теорема Поста: система полна, если не лежит целиком ни в одном классе
+        classes = [formula.post_classes() for formula in formulas]
+        return all(not all(membership[name] for membership in classes)
+                   for name in Formula.POST_CLASSES)
+
     def get_cnf_for_minimization(self):
         cnf = self.to_cnf()
         return cnf
@@ -185,10 +619,77 @@ class Formula:
         return dnf
 
 
+class FormulaCache:
+    # Ограниченный LRU-кэш формул по нормализованному тексту выражения
+    MAXSIZE = 256
+    SYMBOLS = {'∨': '|', '∧': '&', '→': '->', '↔': '~', '¬': '!'}
+
+    def __init__(self, maxsize=MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._formulas = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def normalize(cls, text):
+        text = unicodedata.normalize('NFKC', text)
+        for symbol, replacement in cls.SYMBOLS.items():
+            text = text.replace(symbol, replacement)
+        text = re.sub(r'\s*(->|[()!&|~])\s*', r'\1', text)
+        return ' '.join(text.split())
+
+    def get(self, text, backend=Formula.BITWISE):
+        key = (self.normalize(text), backend)
+        with self._lock:
+            formula = self._formulas.get(key)
+            if formula is not None:
+                self.hits += 1
+                self._formulas.move_to_end(key)
+                return formula
+            self.misses += 1
+        formula = Formula(key[0], backend)
+        with self._lock:
+            formula = self._formulas.setdefault(key, formula)
+            self._formulas.move_to_end(key)
+            while len(self._formulas) > self.maxsize:
+                self._formulas.popitem(last=False)
+        return formula
+
+    def cache_info(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._formulas), "maxsize": self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._formulas.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+formula_cache = FormulaCache()
+
+
+_shard_worker = {}
+
+
+def _init_shard_worker(expression, variables, memory_name):
+    # Формула разбирается и компилируется один раз на процесс
+    _shard_worker["variables"] = variables
+    _shard_worker["evaluate"] = Formula(expression).compile(variables, bitwise=True)
+    _shard_worker["memory"] = shared_memory.SharedMemory(memory_name)
+
+
+def _evaluate_shard(start, bits):
+    variables = _shard_worker["variables"]
+    masks, full = Formula.get_shard_masks(variables, start, bits)
+    vector = _shard_worker["evaluate"](*(masks[var] for var in variables), full)
+    data = vector.to_bytes((1 << bits) // 8, 'little')
+    _shard_worker["memory"].buf[start // 8:start // 8 + len(data)] = data
+
+
 def main():
-    expr = ('!a→(!(b∨c))c'
-            ''
-            '')
+    expr = '!a→(!(b∨c)∨c)'
     formula = Formula(expr)
     table, headers, result_of_expr = formula.create_table_of_truth()
     print(f"Логическое выражение: {expr}")
@@ -199,9 +700,8 @@ def main():
     print("\nСовершенная ДНФ (СДНФ):", formula.to_dnf())
     print("Совершенная КНФ (СКНФ):", formula.to_cnf())
     print("\nЧисловые формы:\n", formula.get_number_forms())
-    result_string = "".join(str(int(r)) for r in result_of_expr)
-    print("\nИндексная форма: ", result_string, "-",
-          formula.binary_to_decimal_number(result_string))
+    result_string, index = formula.get_index_form()
+    print("\nИндексная форма: ", result_string, "-", index)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,186 @@
+import weakref
+
+
+class Node:
+    # Неизменяемый узел дерева разбора. Узлы хешируются по структуре:
+    # одинаковые поддеревья - это один и тот же объект
+    __slots__ = ('operator', 'name', 'children', '__weakref__')
+    _interned = weakref.WeakValueDictionary()
+
+    def __new__(cls, operator, children=(), name=None):
+        key = (operator, name, children)
+        node = cls._interned.get(key)
+        if node is None:
+            node = object.__new__(cls)
+            object.__setattr__(node, 'operator', operator)
+            object.__setattr__(node, 'name', name)
+            object.__setattr__(node, 'children', children)
+            cls._interned[key] = node
+        return node
+
+    @classmethod
+    def variable(cls, name):
+        return cls(None, (), name)
+
+    @classmethod
+    def operation(cls, operator, *children):
+        return cls(operator, tuple(children))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Узлы дерева разбора неизменяемы")
+
+    def __reduce__(self):
+        return Node, (self.operator, self.children, self.name)
+
+    @property
+    def is_variable(self):
+        return self.operator is None
+
+    def iter_nodes(self):
+        # Уникальные узлы, каждый после своих операндов
+        seen = set()
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                yield node
+                continue
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.append((node, True))
+            for child in reversed(node.children):
+                stack.append((child, False))
+
+    def get_variables(self):
+        return sorted(node.name for node in self.iter_nodes() if node.is_variable)
+
+    def to_postfix(self):
+        postfix = []
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node.is_variable:
+                postfix.append(node.name)
+            elif expanded:
+                postfix.append(node.operator)
+            else:
+                stack.append((node, True))
+                for child in reversed(node.children):
+                    stack.append((child, False))
+        return postfix
+
+    def __str__(self):
+        text = {}
+        for node in self.iter_nodes():
+            if node.is_variable:
+                text[node] = node.name
+            elif len(node.children) == 1:
+                text[node] = f"{node.operator}{text[node.children[0]]}"
+            else:
+                left, right = (text[child] for child in node.children)
+                text[node] = f"({left}{node.operator}{right})"
+        return text[self]
+
+    def __repr__(self):
+        return f"Node({str(self)!r})"
+
+
+class Parser:
+    # Разбор приоритетами операторов с явными стеками операндов и
+    # операторов, без рекурсии: глубина вложенности не ограничена стеком
+    # вызовов. Приоритеты берутся из таблицы операторов Formula, все
+    # двухместные операторы левоассоциативны
+    SYMBOLS = {'!': '!', '¬': '!', '&': '&', '∧': '&', '|': '|', '∨': '|',
+               '~': '~', '↔': '~', '→': '->', '(': '(', ')': ')'}
+
+    def __init__(self, operators):
+        self.operators = operators
+
+    def tokenize(self, text):
+        tokens = []
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if char.isspace():
+                i += 1
+            elif char == '-' and text[i + 1:i + 2] == '>':
+                tokens.append(('->', i))
+                i += 2
+            elif char in self.SYMBOLS:
+                tokens.append((self.SYMBOLS[char], i))
+                i += 1
+            elif char.isalpha():
+                start = i
+                while i < len(text) and (text[i].isalpha() or text[i].isdigit()):
+                    i += 1
+                tokens.append((text[start:i], start))
+            else:
+                raise ValueError(f"Неизвестный символ '{char}' в позиции {i}")
+        return tokens
+
+    def parse(self, text):
+        tokens = self.tokenize(text)
+        if not tokens:
+            raise ValueError("Пустое выражение")
+        return self.parse_tokens(tokens, len(text))
+
+    def parse_tokens(self, tokens, end=None):
+        tokens = list(tokens)
+        if end is None:
+            end = len(tokens)
+        operands = []
+        # Элементы стека операторов - (оператор, позиция); скобки тоже здесь
+        pending = []
+        expect_operand = True
+        for token, position in tokens:
+            if expect_operand:
+                if token == '(' or self._is_unary(token):
+                    pending.append((token, position))
+                elif token == ')' or token in self.operators:
+                    raise ValueError(f"Неожиданный символ '{token}' в позиции {position}")
+                else:
+                    operands.append(Node.variable(token))
+                    expect_operand = False
+            elif self._is_binary(token):
+                self._reduce(operands, pending, self.operators[token]["priority"])
+                pending.append((token, position))
+                expect_operand = True
+            elif token == ')':
+                self._reduce(operands, pending, None)
+                if not pending:
+                    raise ValueError(f"Неожиданный символ '{token}' в позиции {position}")
+                pending.pop()
+            elif any(operator == '(' for operator, _ in pending):
+                raise ValueError(f"Ожидалась ')' в позиции {position}")
+            else:
+                raise ValueError(f"Неожиданный символ '{token}' в позиции {position}")
+        if expect_operand:
+            raise ValueError(f"Неожиданный конец выражения в позиции {end}")
+        self._reduce(operands, pending, None)
+        if pending:
+            raise ValueError(f"Ожидалась ')' в позиции {end}")
+        return operands.pop()
+
+    def _reduce(self, operands, pending, priority):
+        # Сворачивает операторы до открывающей скобки; при заданном приоритете -
+        # только те, что связывают сильнее: двухместные с не меньшим
+        # приоритетом (левая ассоциативность), одноместные - с большим
+        while pending and pending[-1][0] != '(':
+            operator = pending[-1][0]
+            if priority is not None:
+                own = self.operators[operator]["priority"]
+                if own < priority or self._is_unary(operator) and own == priority:
+                    return
+            pending.pop()
+            if self._is_unary(operator):
+                operands.append(Node.operation(operator, operands.pop()))
+            else:
+                right = operands.pop()
+                operands.append(Node.operation(operator, operands.pop(), right))
+
+    def _is_unary(self, token):
+        return token in self.operators and self.operators[token]["unary"]
+
+    def _is_binary(self, token):
+        return token in self.operators and not self.operators[token]["unary"]
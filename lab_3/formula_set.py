@@ -0,0 +1,65 @@
+from formula import Formula
+
+
+class FormulaSet:
+    # Набор формул над общим ациклическим графом: одинаковые поддеревья
+    # разных формул - один узел и вычисляются один раз
+    BLOCK_SIZE = 64
+
+    def __init__(self, formulas):
+        self.formulas = [formula if isinstance(formula, Formula) else Formula(formula)
+                         for formula in formulas]
+        if not self.formulas:
+            raise ValueError("Набор формул пуст")
+        self.roots = [formula.get_ast() for formula in self.formulas]
+        self.variables = sorted(set().union(*(formula.get_variables() for formula in self.formulas)))
+        self._evaluators = {}
+
+    def __len__(self):
+        return len(self.formulas)
+
+    def count_nodes(self):
+        nodes = set()
+        for root in self.roots:
+            nodes.update(root.iter_nodes())
+        return len(nodes)
+
+    def compile(self, bitwise=False):
+        if bitwise not in self._evaluators:
+            self._evaluators[bitwise] = Formula.generate_evaluator(
+                self.roots, self.variables, bitwise, f"<formula set of {len(self)}>", as_tuple=True)
+        return self._evaluators[bitwise]
+
+    def _arguments(self, assignment):
+        missing = set(self.variables) - set(assignment)
+        if missing:
+            raise ValueError(f"Не указаны переменные: {missing}")
+        return [assignment[var] for var in self.variables]
+
+    def evaluate(self, assignment):
+        return list(self.compile()(*self._arguments(assignment)))
+
+    def evaluate_many(self, assignments):
+        # Матрица результатов: строка на набор, столбец на формулу;
+        # наборы вычисляются блоками по BLOCK_SIZE, по биту на набор
+        evaluate = self.compile(bitwise=True)
+        matrix = []
+        block = []
+        for assignment in assignments:
+            block.append(self._arguments(assignment))
+            if len(block) == self.BLOCK_SIZE:
+                self._evaluate_block(evaluate, block, matrix)
+                block = []
+        if block:
+            self._evaluate_block(evaluate, block, matrix)
+        return matrix
+
+    def _evaluate_block(self, evaluate, block, matrix):
+        masks = [0] * len(self.variables)
+        for row, values in enumerate(block):
+            for position, value in enumerate(values):
+                if value:
+                    masks[position] |= 1 << row
+        results = evaluate(*masks, (1 << len(block)) - 1)
+        for row in range(len(block)):
+            matrix.append([bool(result >> row & 1) for result in results])
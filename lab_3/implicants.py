@@ -0,0 +1,116 @@
+class TermEncoder:
+    # Терм - пара целых (value, mask): бит mask - переменная входит в терм,
+    # тот же бит value - входит без отрицания. Первая переменная - старший бит
+    def __init__(self, terms):
+        names = sorted({self.variable_name(literal) for term in terms for literal in term})
+        self.variables = names
+        self.bits = {name: 1 << (len(names) - position - 1) for position, name in enumerate(names)}
+        self._decoded = {}
+
+    @staticmethod
+    def variable_name(literal):
+        return literal[1:] if literal.startswith('¬') else literal
+
+    def encode(self, term):
+        # None - терм с переменной и её отрицанием, такие термы не склеиваются
+        value = mask = 0
+        for literal in term:
+            negated = literal.startswith('¬')
+            bit = self.bits[literal[1:] if negated else literal]
+            if mask & bit and bool(value & bit) == negated:
+                return None
+            mask |= bit
+            if not negated:
+                value |= bit
+        return value, mask
+
+    def decode(self, implicant):
+        term = self._decoded.get(implicant)
+        if term is None:
+            value, mask = implicant
+            term = frozenset(name if value & bit else f'¬{name}'
+                             for name, bit in self.bits.items() if mask & bit)
+            self._decoded[implicant] = term
+        return term
+
+    def sort_key(self, term):
+        implicant = self.encode(term)
+        return (1, 0, 0) if implicant is None else (0, implicant[1], implicant[0])
+
+
+def merge_round(implicants):
+    # Для каждого терма проверяются соседи, у которых одна переменная маски
+    # из отрицания стала положительной: поиск по хешу вместо перебора пар
+    positions = {}
+    for index, implicant in enumerate(implicants):
+        if implicant is not None:
+            positions.setdefault(implicant, []).append(index)
+    pairs = []
+    for (value, mask), indices in positions.items():
+        zeros = mask & ~value
+        while zeros:
+            bit = zeros & -zeros
+            zeros ^= bit
+            neighbours = positions.get((value | bit, mask))
+            if neighbours:
+                merged = (value, mask & ~bit)
+                pairs.extend((min(i, j), max(i, j), merged) for i in indices for j in neighbours)
+    pairs.sort(key=lambda pair: (pair[0], pair[1]))
+    return pairs
+
+
+def absorb(implicants):
+    # Индексы термов без дубликатов и без термов, поглощённых
+    # другим термом с меньшим набором переменных
+    present = set(implicants)
+    masks = {mask for _, mask in present}
+    submasks = {mask: [other for other in masks if other != mask and not other & ~mask]
+                for mask in masks}
+    kept = []
+    seen = set()
+    for index, implicant in enumerate(implicants):
+        value, mask = implicant
+        if implicant in seen:
+            continue
+        if any((value & other, other) in present for other in submasks[mask]):
+            continue
+        seen.add(implicant)
+        kept.append(index)
+    return kept
+
+
+def coverage_rows(primes, terms, encoder):
+    # Бит j строки импликанты - терм terms[j] содержит все её литералы.
+    # Термы группируются по маске, внутри группы поиск идёт по значению
+    codes = [encoder.encode(term) for term in terms]
+    groups = {}
+    for index, code in enumerate(codes):
+        if code is not None:
+            groups.setdefault(code[1], []).append(index)
+    tables = {}
+    rows = []
+    for prime in primes:
+        code = encoder.encode(prime)
+        row = 0
+        if code is None:
+            for index, term in enumerate(terms):
+                if prime <= frozenset(term):
+                    row |= 1 << index
+            rows.append(row)
+            continue
+        value, mask = code
+        for term_mask, indices in groups.items():
+            if mask & ~term_mask:
+                continue
+            table = tables.get((term_mask, mask))
+            if table is None:
+                table = tables[(term_mask, mask)] = {}
+                for index in indices:
+                    key = codes[index][0] & mask
+                    table[key] = table.get(key, 0) | 1 << index
+            row |= table.get(value, 0)
+        for index, term_code in enumerate(codes):
+            if term_code is None and prime <= frozenset(terms[index]):
+                row |= 1 << index
+        rows.append(row)
+    return rows
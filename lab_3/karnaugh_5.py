@@ -44,6 +44,11 @@ class KarnaughMapProcessor:
 
         self.display_map()
 
+    @classmethod
+    def from_table_file(cls, path, is_conjunctive_form):
+        truth_table = Formula.from_table_file(path).get_truth_table()
+        return cls(truth_table.variables, truth_table.get_rows(), is_conjunctive_form)
+
     @staticmethod
     def _calculate_position_index(primary, secondary):
         gray_code = {
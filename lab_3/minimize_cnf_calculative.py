@@ -1,4 +1,5 @@
 from formula import Formula
+from implicants import TermEncoder, merge_round
 
 class ConjunctiveNormalFormReducer:
     def __init__(self, initial_expression):
@@ -6,6 +7,10 @@ class ConjunctiveNormalFormReducer:
         self.disjunctive_clauses = self._process_input(initial_expression)
         self.reduction_steps = []
 
+    @classmethod
+    def from_table_file(cls, path):
+        return cls(Formula.from_table_file(path).get_cnf_for_minimization())
+
     @staticmethod
     def _process_input(logical_expression):
         if logical_expression == "True":
@@ -30,6 +35,7 @@ class ConjunctiveNormalFormReducer:
         return set1.intersection(set2)
 
     def simplify(self):
+        encoder = TermEncoder(self.disjunctive_clauses)
         current_clauses = self.disjunctive_clauses.copy()
         iteration = 0
         changed = True
@@ -38,23 +44,23 @@ class ConjunctiveNormalFormReducer:
             changed = False
             print(f"\nИтерация {iteration}: Текущие дизъюнкты: {current_clauses}")
             new_clauses = []
+            seen = set()
             used = set()
 
-            for i in range(len(current_clauses)):
-                for j in range(i + 1, len(current_clauses)):
-                    clause1 = current_clauses[i]
-                    clause2 = current_clauses[j]
-                    if self._check_merge_possibility(clause1, clause2):
-                        merged = self._combine_clauses(clause1, clause2)
-                        if merged not in new_clauses:
-                            new_clauses.append(merged)
-                            used.add(i)
-                            used.add(j)
-                            changed = True
+            for i, j, implicant in merge_round([encoder.encode(clause) for clause in current_clauses]):
+                merged = encoder.decode(implicant)
+                if merged not in seen:
+                    new_clauses.append(set(merged))
+                    seen.add(merged)
+                    used.add(i)
+                    used.add(j)
+                    changed = True
 
             for idx, clause in enumerate(current_clauses):
-                if idx not in used and clause not in new_clauses:
+                key = frozenset(clause)
+                if idx not in used and key not in seen:
                     new_clauses.append(clause)
+                    seen.add(key)
 
             if changed:
                 current_clauses = new_clauses
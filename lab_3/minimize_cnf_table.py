@@ -1,4 +1,6 @@
 from formula import Formula
+from cover import CoverSolver
+from implicants import TermEncoder, coverage_rows, merge_round
 
 class KNF_Optimizer:
     def __init__(self, knf_input):
@@ -9,6 +11,10 @@ class KNF_Optimizer:
         print(f"Исходная КНФ: {self.initial_knf}")
         print(f"Разобранные термы: {self.disjunctive_terms}")
 
+    @classmethod
+    def from_table_file(cls, path):
+        return cls(Formula.from_table_file(path).get_cnf_for_minimization())
+
     @staticmethod
     def _parse_knf(knf_str):
         if knf_str == "True" or not knf_str.strip():
@@ -48,68 +54,57 @@ class KNF_Optimizer:
         print(f"Отфильтрованные термы: {self.optimized_form}")
 
     def _find_core_terms(self):
+        encoder = TermEncoder(self.disjunctive_terms)
         current_terms = self.disjunctive_terms.copy()
         self.core_terms = []
 
         while True:
-            new_terms = []
+            merged_pairs = merge_round([encoder.encode(term) for term in current_terms])
+            # Одинаковые склейки от разных пар печатаются и сохраняются один раз
+            first_pairs = {}
             used_indices = set()
+            for i, j, merged in merged_pairs:
+                first_pairs.setdefault(merged, (i, j))
+                used_indices.update((i, j))
 
-            for i in range(len(current_terms)):
-                for j in range(i + 1, len(current_terms)):
-                    term1 = current_terms[i]
-                    term2 = current_terms[j]
-                    if self._can_combine(term1, term2):
-                        combined = self._combine_terms(term1, term2)
-                        new_terms.append(combined)
-                        used_indices.update((i, j))
-
-            if not new_terms:
+            if not first_pairs:
                 break
 
+            new_terms = []
+            for merged, (i, j) in first_pairs.items():
+                combined = encoder.decode(merged)
+                print(f"Комбинирование: {current_terms[i]} и {current_terms[j]} -> {combined}")
+                new_terms.append(combined)
+
             current_terms = [term for idx, term in enumerate(current_terms) if idx not in used_indices]
-            current_terms.extend(new_terms)
+            current_terms = list(dict.fromkeys(frozenset(term) for term in current_terms + new_terms))
 
-        self.core_terms = list({frozenset(term) for term in current_terms})
+        self.core_terms = sorted({frozenset(term) for term in current_terms}, key=encoder.sort_key)
         print(f"Основные термы: {self.core_terms}")
 
     def _build_coverage_matrix(self):
-        coverage_map = {}
-        for imp in self.core_terms:
-            coverage_map[imp] = []
-            for term in self.disjunctive_terms:
-                if imp.issubset(term):
-                    coverage_map[imp].append(term)
-        print(f"Матрица покрытия: {coverage_map}")
-        return {k: v for k, v in coverage_map.items() if v}
+        # Покрытие импликанты - целое число, бит j - терм disjunctive_terms[j]
+        encoder = TermEncoder(self.disjunctive_terms)
+        rows = coverage_rows(self.core_terms, self.disjunctive_terms, encoder)
+        coverage_map = {imp: row for imp, row in zip(self.core_terms, rows) if row}
+        print(f"Матрица покрытия: { {imp: bin(row) for imp, row in coverage_map.items()} }")
+        return coverage_map
 
     def _select_optimal_cover(self):
         coverage = self._build_coverage_matrix()
         if not coverage:
             raise ValueError("Матрица покрытия пуста")
 
-        covered_terms = set()
-        self.optimized_form = []
-
-        while len(covered_terms) < len(self.disjunctive_terms):
-            best_imp = None
-            max_coverage = 0
-
-            for imp, covers in coverage.items():
-                current_cov = len([t for t in covers if t not in covered_terms])
-                if current_cov > max_coverage:
-                    max_coverage = current_cov
-                    best_imp = imp
-
-            if best_imp is None:
-                self.optimized_form = self.disjunctive_terms.copy()
-                break
-
-            self.optimized_form.append(best_imp)
-            covered_terms.update(coverage[best_imp])
-            del coverage[best_imp]
-
-            print(f"Выбранный импликант: {best_imp}, покрытые термы: {covered_terms}")
+        implicants = list(coverage)
+        selected = CoverSolver(list(coverage.values()), (1 << len(self.disjunctive_terms)) - 1).solve()
+        if selected is None:
+            self.optimized_form = self.disjunctive_terms.copy()
+        else:
+            self.optimized_form = [implicants[index] for index in selected]
+            for imp in self.optimized_form:
+                covered = [self.disjunctive_terms[index] for index in range(len(self.disjunctive_terms))
+                           if coverage[imp] >> index & 1]
+                print(f"Выбранный импликант: {imp}, покрытые термы: {covered}")
 
         self._filter_redundancies()
 
@@ -148,8 +143,8 @@ class KNF_Optimizer:
 
         for imp, covers in coverage.items():
             row = [" ∨ ".join(sorted(imp)).ljust(col_width)]
-            for term in self.disjunctive_terms:
-                mark = "X" if term in covers else ""
+            for index in range(len(self.disjunctive_terms)):
+                mark = "X" if covers >> index & 1 else ""
                 row.append(mark.center(col_width))
             print("|".join(row))
             print(separator)
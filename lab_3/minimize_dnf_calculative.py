@@ -1,4 +1,5 @@
 from formula import *
+from implicants import TermEncoder, absorb, merge_round
 
 class DNFMinimizer:
     def __init__(self, dnf_expression):
@@ -6,6 +7,10 @@ class DNFMinimizer:
         self.terms = self.parse_expression(dnf_expression)
         self.stages = []
 
+    @classmethod
+    def from_table_file(cls, path):
+        return cls(Formula.from_table_file(path).get_dnf_for_minimization())
+
     @staticmethod
     def parse_expression(dnf):
         if dnf == "False":
@@ -47,7 +52,14 @@ class DNFMinimizer:
                 unique.append(t1)
         return unique
 
+    def _remove_absorbed_terms(self, encoder, terms):
+        implicants = [encoder.encode(term) for term in terms]
+        if None in implicants:
+            return self.remove_redundant_terms(terms)
+        return [terms[index].copy() for index in absorb(implicants)]
+
     def minimize_expression(self):
+        encoder = TermEncoder(self.terms)
         current_terms = self.terms.copy()
         stage = 0
         changed = True
@@ -57,29 +69,25 @@ class DNFMinimizer:
             new_terms = []
             merged_pairs = set()
 
-            for i in range(len(current_terms)):
-                for j in range(i + 1, len(current_terms)):
-                    t1 = current_terms[i]
-                    t2 = current_terms[j]
-                    if self.can_combine(t1, t2):
-                        merged = self.combine_terms(t1, t2)
-                        new_terms.append(merged)
-                        merged_pairs.update((i, j))
-                        changed = True
+            for i, j, merged in merge_round([encoder.encode(term) for term in current_terms]):
+                new_terms.append(set(encoder.decode(merged)))
+                merged_pairs.update((i, j))
+                changed = True
 
             for idx, term in enumerate(current_terms):
                 if idx not in merged_pairs:
                     new_terms.append(term.copy())
 
             current_terms = []
-            seen = []
+            seen = set()
             for term in new_terms:
-                if term not in seen:
+                key = frozenset(term)
+                if key not in seen:
                     current_terms.append(term)
-                    seen.append(term)
+                    seen.add(key)
 
             prev_len = len(current_terms)
-            current_terms = self.remove_redundant_terms(current_terms)
+            current_terms = self._remove_absorbed_terms(encoder, current_terms)
             if len(current_terms) != prev_len:
                 changed = True
 
@@ -1,5 +1,7 @@
 from itertools import combinations
 from formula import Formula
+from cover import CoverSolver
+from implicants import TermEncoder, coverage_rows, merge_round
 
 
 class PerfectDNF_Optimizer:
@@ -9,6 +11,10 @@ class PerfectDNF_Optimizer:
         self.essential_primes = []
         self.optimized_result = []
 
+    @classmethod
+    def from_table_file(cls, path):
+        return cls(Formula.from_table_file(path).get_dnf_for_minimization())
+
     @staticmethod
     def _parse_expression(logical_str):
         if logical_str == "False" or not logical_str.strip():
@@ -33,21 +39,14 @@ class PerfectDNF_Optimizer:
         return term_A.intersection(term_B)
 
     def _extract_prime_implicants(self):
+        encoder = TermEncoder(self.conjunctive_terms)
         current_terms = self.conjunctive_terms.copy()
         self.essential_primes = []
 
         while True:
-            new_terms = []
-            processed_indices = set()
-
-            for i in range(len(current_terms)):
-                for j in range(i + 1, len(current_terms)):
-                    term_A = current_terms[i]
-                    term_B = current_terms[j]
-                    if self._check_merge_condition(term_A, term_B):
-                        combined = self._combine_implicants(term_A, term_B)
-                        new_terms.append(combined)
-                        processed_indices.update((i, j))
+            merged_pairs = merge_round([encoder.encode(term) for term in current_terms])
+            new_terms = [encoder.decode(merged) for merged in dict.fromkeys(merged for _, _, merged in merged_pairs)]
+            processed_indices = {index for i, j, _ in merged_pairs for index in (i, j)}
 
             for idx, term in enumerate(current_terms):
                 if idx not in processed_indices:
@@ -62,16 +61,14 @@ class PerfectDNF_Optimizer:
         if not self.essential_primes:
             self.essential_primes = self.conjunctive_terms.copy()
 
-        self.essential_primes = list({frozenset(term) for term in self.essential_primes})
+        self.essential_primes = sorted({frozenset(term) for term in self.essential_primes},
+                                       key=encoder.sort_key)
 
     def _construct_coverage_matrix(self):
-        coverage_map = {}
-        for prime in self.essential_primes:
-            coverage_map[prime] = []
-            for term in self.conjunctive_terms:
-                if prime.issubset(term):
-                    coverage_map[prime].append(term)
-        return {k: v for k, v in coverage_map.items() if v}
+        # Покрытие импликанты - целое число, бит j - терм conjunctive_terms[j]
+        encoder = TermEncoder(self.conjunctive_terms)
+        rows = coverage_rows(self.essential_primes, self.conjunctive_terms, encoder)
+        return {prime: row for prime, row in zip(self.essential_primes, rows) if row}
 
     def _eliminate_redundant_primes(self):
         essential_terms = []
@@ -88,26 +85,12 @@ class PerfectDNF_Optimizer:
         if not coverage_data:
             raise ValueError("Матрица покрытия пуста")
 
-        covered_terms = set()
-        self.optimized_result = []
-
-        while len(covered_terms) < len(self.conjunctive_terms):
-            best_prime = None
-            max_coverage = 0
-
-            for prime, covered in coverage_data.items():
-                current_count = len([t for t in covered if t not in covered_terms])
-                if current_count > max_coverage:
-                    max_coverage = current_count
-                    best_prime = prime
-
-            if best_prime is None:
-                self.optimized_result = self.conjunctive_terms.copy()
-                break
-
-            self.optimized_result.append(best_prime)
-            covered_terms.update(coverage_data[best_prime])
-            del coverage_data[best_prime]
+        primes = list(coverage_data)
+        selected = CoverSolver(list(coverage_data.values()), (1 << len(self.conjunctive_terms)) - 1).solve()
+        if selected is None:
+            self.optimized_result = self.conjunctive_terms.copy()
+        else:
+            self.optimized_result = [primes[index] for index in selected]
 
         self._eliminate_redundant_primes()
 
@@ -141,8 +124,8 @@ class PerfectDNF_Optimizer:
 
         for prime, covered in coverage_data.items():
             row = [" ∧ ".join(sorted(prime)).ljust(column_width)]
-            for term in self.conjunctive_terms:
-                marker = "X" if term in covered else ""
+            for index in range(len(self.conjunctive_terms)):
+                marker = "X" if covered >> index & 1 else ""
                 row.append(marker.center(column_width))
             print("|".join(row))
             print(separator)
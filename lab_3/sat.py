@@ -0,0 +1,297 @@
+import heapq
+
+
+class TseitinEncoder:
+    # Переменные формулы получают номера 1..k, каждый двухместный оператор -
+    # вспомогательную переменную; отрицание кодируется знаком литерала
+    def __init__(self, formula):
+        self.names = formula.get_variables()
+        self.variables = {name: i + 1 for i, name in enumerate(self.names)}
+        self.num_vars = len(self.names)
+        self.gates = []
+        self._gate_cache = {}
+        root = formula.get_ast()
+        literals = {}
+        for node in root.iter_nodes():
+            if node.is_variable:
+                literals[node] = self.variables[node.name]
+            elif len(node.children) == 1:
+                literals[node] = -literals[node.children[0]]
+            else:
+                a, b = (literals[child] for child in node.children)
+                literals[node] = self._gate(node.operator, a, b)
+        self.root = literals[root]
+
+    def _gate(self, operator, a, b):
+        key = (operator, a, b)
+        if key not in self._gate_cache:
+            self.num_vars += 1
+            self.gates.append((self.num_vars, operator, a, b))
+            self._gate_cache[key] = self.num_vars
+        return self._gate_cache[key]
+
+    @staticmethod
+    def gate_clauses(x, operator, a, b):
+        if operator == '&':
+            return [(-x, a), (-x, b), (x, -a, -b)]
+        if operator == '|':
+            return [(x, -a), (x, -b), (-x, a, b)]
+        if operator == '->':
+            return [(x, a), (x, -b), (-x, -a, b)]
+        if operator == '~':
+            return [(-x, -a, b), (-x, a, -b), (x, a, b), (x, -a, -b)]
+        raise ValueError(f"Неизвестный оператор: {operator}")
+
+    @property
+    def num_clauses(self):
+        return sum(4 if operator == '~' else 3 for _, operator, _, _ in self.gates) + 1
+
+    def iter_clauses(self):
+        for x, operator, a, b in self.gates:
+            yield from self.gate_clauses(x, operator, a, b)
+        yield (self.root,)
+
+    def decode(self, model):
+        return {name: model[index] for name, index in self.variables.items()}
+
+    def write_dimacs(self, fp):
+        for name, index in self.variables.items():
+            fp.write(f"c {index} {name}\n")
+        fp.write(f"p cnf {self.num_vars} {self.num_clauses}\n")
+        for clause in self.iter_clauses():
+            fp.write(" ".join(map(str, clause)) + " 0\n")
+        return self.num_vars, self.num_clauses
+
+
+def read_dimacs(fp):
+    num_vars = 0
+    clauses = []
+    literals = []
+    for line in fp:
+        line = line.strip()
+        if not line or line.startswith('c'):
+            continue
+        if line.startswith('p'):
+            num_vars = int(line.split()[2])
+            continue
+        for literal in map(int, line.split()):
+            if literal:
+                literals.append(literal)
+            else:
+                clauses.append(literals)
+                literals = []
+    return num_vars, clauses
+
+
+class CDCLSolver:
+    # Обучение конфликтным дизъюнктам (первая точка доминирования),
+    # два наблюдаемых литерала, выбор переменной по активности (VSIDS)
+    # и перезапуски по последовательности Луби
+    RESTART_BASE = 100
+    ACTIVITY_DECAY = 0.95
+    ACTIVITY_LIMIT = 1e100
+
+    def __init__(self, num_vars, clauses=()):
+        self.num_vars = num_vars
+        self.clauses = []
+        self.watches = [[] for _ in range(2 * num_vars + 2)]
+        self.values = [0] * (num_vars + 1)
+        self.levels = [0] * (num_vars + 1)
+        self.reasons = [None] * (num_vars + 1)
+        self.phases = [False] * (num_vars + 1)
+        self.activity = [0.0] * (num_vars + 1)
+        self.increment = 1.0
+        self.heap = [(0.0, var) for var in range(1, num_vars + 1)]
+        self.trail = []
+        self.trail_limits = []
+        self.queue_head = 0
+        self.unsat = False
+        self.conflicts = 0
+        for clause in clauses:
+            self.add_clause(clause)
+
+    @staticmethod
+    def _index(literal):
+        return 2 * abs(literal) + (literal < 0)
+
+    def _value(self, literal):
+        value = self.values[abs(literal)]
+        return value if literal > 0 else -value
+
+    def _decision_level(self):
+        return len(self.trail_limits)
+
+    def _enqueue(self, literal, reason):
+        var = abs(literal)
+        self.values[var] = 1 if literal > 0 else -1
+        self.levels[var] = self._decision_level()
+        self.reasons[var] = reason
+        self.trail.append(literal)
+
+    def _watch(self, clause):
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        self.watches[self._index(clause[0])].append(index)
+        self.watches[self._index(clause[1])].append(index)
+        return index
+
+    def add_clause(self, clause):
+        if self._decision_level():
+            raise ValueError("Дизъюнкты добавляются только до начала поиска")
+        literals = list(dict.fromkeys(clause))
+        if any(-literal in literals for literal in literals):
+            return
+        for literal in literals:
+            if not 0 < abs(literal) <= self.num_vars:
+                raise ValueError(f"Некорректный литерал: {literal}")
+        literals = [literal for literal in literals if self._value(literal) != -1]
+        if any(self._value(literal) == 1 for literal in literals):
+            return
+        if not literals:
+            self.unsat = True
+        elif len(literals) == 1:
+            self._enqueue(literals[0], None)
+        else:
+            self._watch(literals)
+
+    def _propagate(self):
+        while self.queue_head < len(self.trail):
+            false_literal = -self.trail[self.queue_head]
+            self.queue_head += 1
+            watchers = self.watches[self._index(false_literal)]
+            kept = []
+            self.watches[self._index(false_literal)] = kept
+            for position, clause_index in enumerate(watchers):
+                clause = self.clauses[clause_index]
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], clause[0]
+                first = clause[0]
+                if self._value(first) == 1:
+                    kept.append(clause_index)
+                    continue
+                for k in range(2, len(clause)):
+                    if self._value(clause[k]) != -1:
+                        clause[1], clause[k] = clause[k], clause[1]
+                        self.watches[self._index(clause[1])].append(clause_index)
+                        break
+                else:
+                    kept.append(clause_index)
+                    if self._value(first) == -1:
+                        kept.extend(watchers[position + 1:])
+                        self.queue_head = len(self.trail)
+                        return clause_index
+                    self._enqueue(first, clause_index)
+        return None
+
+    def _bump(self, var):
+        self.activity[var] += self.increment
+        if self.activity[var] > self.ACTIVITY_LIMIT:
+            self.activity = [activity / self.ACTIVITY_LIMIT for activity in self.activity]
+            self.increment /= self.ACTIVITY_LIMIT
+            self.heap = [(-self.activity[v], v) for v in range(1, self.num_vars + 1)
+                         if not self.values[v]]
+            heapq.heapify(self.heap)
+        elif not self.values[var]:
+            heapq.heappush(self.heap, (-self.activity[var], var))
+
+    def _analyze(self, conflict):
+        seen = set()
+        learned = [None]
+        counter = 0
+        literal = None
+        position = len(self.trail) - 1
+        clause = self.clauses[conflict]
+        level = self._decision_level()
+        while True:
+            for q in clause:
+                var = abs(q)
+                if q == literal or var in seen or self.levels[var] == 0:
+                    continue
+                seen.add(var)
+                self._bump(var)
+                if self.levels[var] == level:
+                    counter += 1
+                else:
+                    learned.append(q)
+            while abs(self.trail[position]) not in seen:
+                position -= 1
+            literal = self.trail[position]
+            position -= 1
+            counter -= 1
+            if not counter:
+                break
+            clause = self.clauses[self.reasons[abs(literal)]]
+        learned[0] = -literal
+        backjump = 0
+        if len(learned) > 1:
+            deepest = max(range(1, len(learned)), key=lambda i: self.levels[abs(learned[i])])
+            learned[1], learned[deepest] = learned[deepest], learned[1]
+            backjump = self.levels[abs(learned[1])]
+        return learned, backjump
+
+    def _backtrack(self, level):
+        if self._decision_level() <= level:
+            return
+        start = self.trail_limits[level]
+        for literal in self.trail[start:]:
+            var = abs(literal)
+            self.phases[var] = literal > 0
+            self.values[var] = 0
+            self.reasons[var] = None
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[start:]
+        del self.trail_limits[level:]
+        self.queue_head = len(self.trail)
+
+    def _pick_branch(self):
+        while self.heap:
+            _, var = heapq.heappop(self.heap)
+            if not self.values[var]:
+                return var if self.phases[var] else -var
+        return None
+
+    @staticmethod
+    def luby(index):
+        size, sequence = 1, 0
+        while size < index + 1:
+            sequence += 1
+            size = 2 * size + 1
+        while size - 1 != index:
+            size = (size - 1) >> 1
+            sequence -= 1
+            index %= size
+        return 1 << sequence
+
+    def solve(self):
+        if self.unsat or self._propagate() is not None:
+            self.unsat = True
+            return None
+        restarts = 0
+        limit = self.RESTART_BASE * self.luby(restarts)
+        since_restart = 0
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                since_restart += 1
+                if not self._decision_level():
+                    self.unsat = True
+                    return None
+                learned, level = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learned) == 1:
+                    self._enqueue(learned[0], None)
+                else:
+                    self._enqueue(learned[0], self._watch(learned))
+                self.increment /= self.ACTIVITY_DECAY
+                if since_restart >= limit:
+                    restarts += 1
+                    since_restart = 0
+                    limit = self.RESTART_BASE * self.luby(restarts)
+                    self._backtrack(0)
+                continue
+            literal = self._pick_branch()
+            if literal is None:
+                return [None] + [value == 1 for value in self.values[1:]]
+            self.trail_limits.append(len(self.trail))
+            self._enqueue(literal, None)
@@ -0,0 +1,85 @@
+import json
+import mmap
+import struct
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TruthTableFile:
+    # Формат файла: сигнатура, длина заголовка, заголовок JSON (переменные
+    # в порядке строк и текст формулы), выравнивание до 8 байт и упакованный
+    # вектор значений - бит i байта k соответствует строке 8k + i
+    MAGIC = b'TTBL'
+    VERSION = 1
+    PREFIX = struct.Struct('<4sHxxI')
+    ALIGNMENT = 8
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+        except (ValueError, struct.error):
+            self._mmap.close()
+            raise
+
+    def _read_header(self):
+        magic, version, header_size = self.PREFIX.unpack_from(self._mmap, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("Файл не является таблицей истинности")
+        start = self.PREFIX.size
+        header = json.loads(self._mmap[start:start + header_size].decode('utf-8'))
+        if not isinstance(header, dict) or not isinstance(header.get("variables"), list) \
+                or not isinstance(header.get("expression"), str):
+            raise ValueError("Повреждён заголовок таблицы истинности")
+        self.variables = header["variables"]
+        self.expression = header["expression"]
+        self.size = 1 << len(self.variables)
+        self.offset = self._align(start + header_size)
+        self.nbytes = (self.size + 7) // 8
+        if self.offset + self.nbytes > len(self._mmap):
+            raise ValueError("Файл таблицы истинности обрезан")
+
+    @classmethod
+    def _align(cls, position):
+        return -(-position // cls.ALIGNMENT) * cls.ALIGNMENT
+
+    @classmethod
+    def write(cls, path, variables, data, expression):
+        # Формула обязательна: Formula.from_table_file разбирает её заново
+        if not expression.strip():
+            raise ValueError("Пустое выражение")
+        header = json.dumps({"variables": list(variables), "expression": expression},
+                            ensure_ascii=False).encode('utf-8')
+        if len(data) != (((1 << len(variables)) + 7) // 8):
+            raise ValueError("Размер вектора не соответствует числу переменных")
+        start = cls.PREFIX.size + len(header)
+        with open(path, 'wb') as file:
+            file.write(cls.PREFIX.pack(cls.MAGIC, cls.VERSION, len(header)))
+            file.write(header)
+            file.write(b'\0' * (cls._align(start) - start))
+            file.write(data)
+
+    def data(self):
+        return memoryview(self._mmap)[self.offset:self.offset + self.nbytes]
+
+    def packed(self):
+        # Представление поверх отображённого файла, без копирования
+        if np is None:
+            raise ImportError("Для представлений NumPy требуется пакет numpy")
+        return np.frombuffer(self._mmap, dtype=np.uint8, count=self.nbytes, offset=self.offset)
+
+    def values(self):
+        return np.unpackbits(self.packed(), count=self.size, bitorder='little').view(bool)
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
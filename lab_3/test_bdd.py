@@ -0,0 +1,95 @@
+import unittest
+from formula import Formula
+from bdd import BDD, formulas_equivalent
+
+
+class TestBDD(unittest.TestCase):
+    def setUp(self):
+        self.expressions = [
+            "a ∧ b",
+            "(a ∨ b) ∧ !c",
+            "!(a→(b∧!c))",
+            "(a ↔ b) ∨ (c → d)",
+            "a | !a",
+            "a & !a",
+        ]
+
+    def test_reduction(self):
+        bdd = BDD()
+        self.assertEqual(bdd.from_formula(Formula("a | !a")), BDD.TRUE)
+        self.assertEqual(bdd.from_formula(Formula("a & !a")), BDD.FALSE)
+        self.assertEqual(bdd.from_formula(Formula("a & b")), bdd.from_formula(Formula("!(!a | !b)")))
+
+    def test_minterms_match_truth_table(self):
+        for expr in self.expressions:
+            with self.subTest(expr=expr):
+                formula = Formula(expr)
+                truth_table = formula.get_truth_table()
+                bdd = BDD()
+                node = bdd.from_formula(formula)
+                self.assertEqual(list(bdd.iter_minterms(node, truth_table.variables)), truth_table.minterms())
+                self.assertEqual(list(bdd.iter_maxterms(node, truth_table.variables)), truth_table.maxterms())
+                self.assertEqual(bdd.count_models(node, truth_table.variables), len(truth_table.minterms()))
+
+    def test_variable_order(self):
+        formula = Formula("(a ∧ d) ∨ (b ∧ e) ∨ (c ∧ f)")
+        variables = formula.get_variables()
+        good = BDD(['a', 'd', 'b', 'e', 'c', 'f'])
+        bad = BDD(['a', 'b', 'c', 'd', 'e', 'f'])
+        good_node = good.from_formula(formula)
+        bad_node = bad.from_formula(formula)
+        self.assertLess(len(good), len(bad))
+        self.assertEqual(list(good.iter_minterms(good_node, variables)),
+                         list(bad.iter_minterms(bad_node, variables)))
+
+    def test_satisfiability(self):
+        bdd = BDD()
+        self.assertTrue(bdd.is_satisfiable(bdd.from_formula(Formula("a & b"))))
+        self.assertFalse(bdd.is_satisfiable(bdd.from_formula(Formula("a & !a"))))
+        self.assertTrue(bdd.is_tautology(bdd.from_formula(Formula("(a → b) ∨ a"))))
+
+    def test_equivalence(self):
+        self.assertTrue(formulas_equivalent(Formula("a → b"), Formula("!a | b")))
+        self.assertTrue(formulas_equivalent(Formula("!(a & b)"), Formula("!a | !b")))
+        self.assertFalse(formulas_equivalent(Formula("a → b"), Formula("b → a")))
+
+    def test_count_models_extra_variables(self):
+        bdd = BDD()
+        node = bdd.from_formula(Formula("a & b"))
+        self.assertEqual(bdd.count_models(node), 1)
+        self.assertEqual(bdd.count_models(node, ['a', 'b', 'c']), 2)
+        with self.assertRaises(ValueError):
+            bdd.count_models(node, ['a'])
+
+    def test_cover(self):
+        for expr in self.expressions:
+            with self.subTest(expr=expr):
+                formula = Formula(expr)
+                bdd = BDD()
+                node = bdd.from_formula(formula)
+                cover = list(bdd.iter_cover(node))
+                terms = [" ∧ ".join(var if value else f"!{var}" for var, value in cube.items()) or "a | !a"
+                         for cube in cover]
+                self.assertEqual(bdd.from_formula(Formula(" ∨ ".join(f"({term})" for term in terms) or "a & !a")),
+                                 node)
+        # Путей к 1 много больше: они не пересекаются. Покрытие - куб на дизъюнкт
+        formula = Formula(" ∨ ".join(f"(x{i} ∧ y{i})" for i in range(5)))
+        bdd = BDD()
+        node = bdd.from_formula(formula)
+        self.assertEqual(len(list(bdd.iter_models(node))), 80)
+        self.assertEqual(sorted(map(sorted, (cube.items() for cube in bdd.iter_cover(node)))),
+                         [[(f'x{i}', True), (f'y{i}', True)] for i in range(5)])
+
+    def test_wide_formula(self):
+        names = [f"x{chr(97 + i // 26)}{chr(97 + i % 26)}" for i in range(60)]
+        expr = " ∨ ".join(f"({names[i]} ∧ {names[i + 1]})" for i in range(0, 60, 2))
+        formula = Formula(expr)
+        bdd = BDD()
+        node = bdd.from_formula(formula)
+        self.assertEqual(bdd.count_models(node), 2 ** 60 - 3 ** 30)
+        first = next(bdd.iter_minterms(node, formula.get_variables()))
+        self.assertEqual(first, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import random
+import unittest
+from itertools import combinations, count
+from unittest import mock
+from cover import CoverSolver, iter_bits
+
+
+def bits(*columns):
+    return sum(1 << column for column in columns)
+
+
+class TestCoverSolver(unittest.TestCase):
+    def test_beats_greedy(self):
+        rows = [bits(0, 1, 2, 3), bits(0, 1, 4), bits(2, 3, 5)]
+        solver = CoverSolver(rows)
+        self.assertEqual(len(solver.greedy((1 << len(rows)) - 1, solver.columns)), 3)
+        self.assertEqual(solver.solve(), [1, 2])
+        self.assertTrue(solver.optimal)
+
+    def test_cyclic_core(self):
+        rows = [bits(0, 1), bits(1, 2), bits(2, 3), bits(3, 4), bits(4, 5), bits(5, 0)]
+        self.assertEqual(len(CoverSolver(rows).solve()), 3)
+
+    def test_iter_bits(self):
+        self.assertEqual(list(iter_bits(bits(0, 3, 64))), [0, 3, 64])
+
+    def test_uncoverable(self):
+        self.assertIsNone(CoverSolver([bits(0), bits(1)], bits(0, 1, 2)).solve())
+
+    def test_minimal_on_random_instances(self):
+        generator = random.Random(11)
+        for _ in range(60):
+            columns = generator.randint(1, 10)
+            rows = [generator.getrandbits(columns) for _ in range(generator.randint(1, 8))]
+            universe = 0
+            for row in rows:
+                universe |= row
+            selected = CoverSolver(rows).solve()
+            covered = 0
+            for index in selected:
+                covered |= rows[index]
+            self.assertEqual(covered, universe)
+            expected = min(size for size in range(len(rows) + 1)
+                           for combination in combinations(rows, size)
+                           if _union(combination) == universe)
+            self.assertEqual(len(selected), expected)
+
+    def test_time_budget_falls_back(self):
+        generator = random.Random(5)
+        rows = [generator.getrandbits(40) for _ in range(40)]
+        solver = CoverSolver(rows, time_budget=0)
+        selected = solver.solve()
+        self.assertFalse(solver.optimal)
+        self.assertEqual(_union(rows[index] for index in selected), solver.columns)
+
+    def test_deadline_inside_reduction(self):
+        # Часы сдвигаются на секунду при каждом чтении: бюджет кончается
+        # посреди отбрасывания доминируемых строк, квадратичный проход
+        # не доводится до конца
+        generator = random.Random(7)
+        rows = [_CountingRow(generator.getrandbits(200) & generator.getrandbits(200)) for _ in range(1500)]
+        clock = count()
+        with mock.patch('cover.time.monotonic', side_effect=lambda: next(clock)):
+            solver = CoverSolver(rows, time_budget=3)
+            selected = solver.solve()
+        self.assertFalse(solver.optimal)
+        self.assertLess(_CountingRow.operations, 20 * len(rows))
+        self.assertEqual(_union(rows[index] for index in selected), solver.columns)
+
+
+class _CountingRow(int):
+    operations = 0
+
+    def __and__(self, other):
+        _CountingRow.operations += 1
+        return int(self) & other
+
+
+def _union(rows):
+    result = 0
+    for row in rows:
+        result |= row
+    return result
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import random
+import unittest
+from unittest import mock
+from espresso import EspressoMinimizer
+from formula import Formula
+
+
+class TestEspressoMinimizer(unittest.TestCase):
+    def test_minimize_dnf(self):
+        test_cases = [
+            ("(a ∧ b) ∨ (a ∧ ¬b)", "(a)"),
+            ("(a ∧ b ∧ c) ∨ (a ∧ b ∧ ¬c)", "(a ∧ b)"),
+            ("(a ∧ ¬b ∧ ¬c) ∨ (a ∧ ¬b ∧ c) ∨ (a ∧ b ∧ c)", "(a ∧ c) ∨ (a ∧ ¬b)"),
+            ("(a) ∨ (¬a)", "True"),
+            ("False", "False"),
+        ]
+        for expr, expected in test_cases:
+            with self.subTest(expr=expr):
+                self.assertEqual(EspressoMinimizer.from_dnf(expr).minimize(), expected)
+
+    def test_minimize_cnf(self):
+        test_cases = [
+            ("(a ∨ b) ∧ (a ∨ ¬b)", "(a)"),
+            ("(a ∨ b) ∧ (a ∨ ¬b) ∧ (¬a ∨ c)", "(c) ∧ (a)"),
+            ("(a) ∧ (¬a)", "False"),
+            ("True", "True"),
+        ]
+        for expr, expected in test_cases:
+            with self.subTest(expr=expr):
+                self.assertEqual(EspressoMinimizer.from_cnf(expr).minimize(), expected)
+
+    def test_equivalent_to_formula(self):
+        expressions = ["!(a→(b∧!c))", "(a ~ b) | (c & !d)", "(a -> b) & (b -> c) & (c -> !a)", "a ~ (b ~ (c ~ d))"]
+        for expr in expressions:
+            formula = Formula(expr)
+            for minimizer in (EspressoMinimizer.from_formula(formula),
+                              EspressoMinimizer.from_dnf(formula.to_dnf(), formula.get_variables())):
+                with self.subTest(expr=expr, form=minimizer.form):
+                    self.assertTrue(formula.equivalent(Formula(minimizer.minimize())))
+            with self.subTest(expr=expr, form=EspressoMinimizer.CNF):
+                minimizer = EspressoMinimizer.from_cnf(formula.to_cnf(), formula.get_variables())
+                self.assertTrue(formula.equivalent(Formula(minimizer.minimize())))
+
+    def test_cyclic_cover(self):
+        minimizer = EspressoMinimizer.from_dnf(
+            "(¬a ∧ ¬b ∧ ¬c) ∨ (¬a ∧ b ∧ ¬c) ∨ (¬a ∧ b ∧ c) ∨ (a ∧ ¬b ∧ ¬c) ∨ (a ∧ ¬b ∧ c) ∨ (a ∧ b ∧ c)")
+        minimizer.minimize()
+        self.assertEqual(len(minimizer.cover), 3)
+
+    def test_dont_cares(self):
+        variables = ['a', 'b']
+        on_set = [EspressoMinimizer.encode(variables, {'a', 'b'})]
+        dont_cares = [EspressoMinimizer.encode(variables, {'a', '¬b'})]
+        self.assertEqual(EspressoMinimizer(variables, on_set, dont_cares=dont_cares).minimize(), "(a)")
+
+    def test_wide_cube_list(self):
+        names = [f'x{i}' for i in range(64)]
+        terms = []
+        for group in range(8):
+            a, b, c, d = names[4 * group:4 * group + 4]
+            terms += [{a, b, c, d}, {a, b, c, f'¬{d}'}, {a, b, c, d, '¬x63'}]
+        minimizer = EspressoMinimizer.from_terms(terms, names)
+        minimizer.minimize()
+        self.assertEqual(sorted(map(sorted, map(minimizer.decode, minimizer.cover))),
+                         sorted(sorted(names[4 * group:4 * group + 3]) for group in range(8)))
+
+    def test_random_wide_cover(self):
+        # Покрытие равносильно исходному: каждый исходный куб покрыт
+        # результатом, каждая импликанта - исходными кубами
+        generator = random.Random(3)
+        names = [f'x{i}' for i in range(32)]
+        terms = [{name if generator.random() < 0.5 else f'¬{name}' for name in generator.sample(names, 10)}
+                 for _ in range(60)]
+        minimizer = EspressoMinimizer.from_terms(terms, names)
+        minimizer.minimize()
+        self.assertLessEqual(len(minimizer.cover), len(terms))
+        for cube in minimizer.on_set:
+            self.assertTrue(minimizer.covers(minimizer.cover, cube))
+        for cube in minimizer.cover:
+            self.assertTrue(minimizer.covers(minimizer.on_set, cube))
+        for _ in range(200):
+            point = {name: generator.random() < 0.5 for name in names}
+            expected = any(all(point[literal.lstrip('¬')] != literal.startswith('¬') for literal in term)
+                           for term in terms)
+            cube = EspressoMinimizer.encode(names, [name if value else f'¬{name}' for name, value in point.items()])
+            self.assertEqual(any(not cube & ~prime for prime in minimizer.cover), expected)
+
+    def test_formula_start_cover(self):
+        # Кубы берутся из дерева разбора, а не из путей диаграммы решений
+        generator = random.Random(5)
+        names = [f'x{i}' for i in range(22)]
+        terms = [{name if generator.random() < 0.5 else f'¬{name}' for name in generator.sample(names, 3)}
+                 for _ in range(22)]
+        formula = Formula(" ∨ ".join(f"({' ∧ '.join(sorted(term))})" for term in terms))
+        minimizer = EspressoMinimizer.from_formula(formula)
+        self.assertEqual(len(minimizer.on_set), len({frozenset(term) for term in terms}))
+        self.assertEqual(minimizer.minimize(), EspressoMinimizer.from_terms(terms, formula.get_variables()).minimize())
+
+    def test_formula_start_cover_limit(self):
+        formula = Formula("(a ∨ b) ∧ (c ∨ d) ∧ (a → e)")
+        with mock.patch.object(EspressoMinimizer, 'AST_LIMIT', 2):
+            for form in (EspressoMinimizer.DNF, EspressoMinimizer.CNF):
+                with self.subTest(form=form):
+                    minimizer = EspressoMinimizer.from_formula(formula, form)
+                    self.assertTrue(formula.equivalent(Formula(minimizer.minimize())))
+
+    def test_dense_cover(self):
+        # Переменных больше TABLE_VARIABLES: тавтология делит кубы, пока их
+        # не станет мало. Результат сверяется с таблицей истинности
+        generator = random.Random(11)
+        names = [f'x{i}' for i in range(16)]
+        terms = [{name if generator.random() < 0.5 else f'¬{name}' for name in generator.sample(names, 5)}
+                 for _ in range(80)]
+        minimizer = EspressoMinimizer.from_terms(terms, names)
+        minimizer.minimize()
+        masks, full = Formula.get_variable_masks(names)
+
+        def table(cover):
+            result = 0
+            for term in cover:
+                row = full
+                for literal in term:
+                    row &= full & ~masks[literal[1:]] if literal.startswith('¬') else masks[literal]
+                result |= row
+            return result
+
+        self.assertEqual(table(map(minimizer.decode, minimizer.cover)), table(terms))
+        for cube in minimizer.cover:
+            for bit in range(0, 2 * len(names), 2):
+                if not cube >> bit & cube >> bit + 1 & 1:
+                    self.assertFalse(minimizer.covers(minimizer.on_set, cube | 0b11 << bit))
+
+    def test_unknown_variable(self):
+        with self.assertRaises(ValueError):
+            EspressoMinimizer.from_dnf("(a ∧ b)", ['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
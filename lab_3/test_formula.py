@@ -0,0 +1,316 @@
+import io
+import unittest
+from formula import Formula, FormulaCache, TruthTable
+
+
+class TestFormulaTruthVector(unittest.TestCase):
+    def test_variable_masks(self):
+        masks, full = Formula.get_variable_masks(['a', 'b', 'c'])
+        self.assertEqual(full, 0xFF)
+        self.assertEqual(masks, {'a': 0b11110000, 'b': 0b11001100, 'c': 0b10101010})
+
+    def test_truth_vector(self):
+        self.assertEqual(Formula("a ∧ b").get_truth_vector(), 0b1000)
+        self.assertEqual(Formula("a → b").get_truth_vector(), 0b1011)
+        self.assertEqual(Formula("a ↔ b").get_truth_vector(), 0b1001)
+
+    def test_table_matches_row_evaluation(self):
+        formula = Formula("!(a→(b∧!c))∨(d~a)")
+        table, headers, results = formula.create_table_of_truth()
+        variables = headers[:-1]
+        for row in table:
+            expected = formula.evaluate_of_expr(**dict(zip(variables, row[:-1])))
+            self.assertEqual(row[-1], expected)
+        self.assertEqual(results, [row[-1] for row in table])
+
+    def test_forms(self):
+        formula = Formula("(a∨b)∧!c")
+        self.assertEqual(formula.to_dnf(), "(¬a ∧ b ∧ ¬c) ∨ (a ∧ ¬b ∧ ¬c) ∨ (a ∧ b ∧ ¬c)")
+        self.assertEqual(formula.get_number_forms(), "(2,4,6) ∨\n(0,1,3,5,7) ∧")
+        self.assertEqual(formula.get_index_form(), ("00101010", 42))
+
+    def test_missing_variables(self):
+        with self.assertRaises(ValueError):
+            Formula("a & b").evaluate_of_expr(a=True)
+
+    def test_invalid_expression(self):
+        with self.assertRaises(ValueError):
+            Formula("a1 & b$").get_truth_vector()
+        self.assertEqual(Formula("a1 & b").get_variables(), ["a1", "b"])
+
+    def test_wide_formula(self):
+        expr = " ∧ ".join(f"(x{chr(97 + i)} ∨ y{chr(97 + i)})" for i in range(8))
+        formula = Formula(expr)
+        disjunction = formula.get_number_forms().split("\n")[0]
+        self.assertEqual(disjunction.count(",") + 1, 3 ** 8)
+
+
+class TestFormulaCompile(unittest.TestCase):
+    def test_compile_positional(self):
+        formula = Formula("(a → b) ∧ !c")
+        evaluate = formula.compile()
+        for combo in formula.combinations():
+            values = tuple(combo[var] for var in formula.get_variables())
+            self.assertEqual(evaluate(*values), formula.evaluate_of_expr(**combo))
+
+    def test_compile_is_cached(self):
+        formula = Formula("a ∨ b")
+        self.assertIs(formula.compile(), formula.compile())
+        formula.expression = "a & b"
+        self.assertFalse(formula.compile()(True, False))
+
+    def test_compile_bitwise(self):
+        formula = Formula("a ↔ b")
+        masks, full = Formula.get_variable_masks(['a', 'b'])
+        self.assertEqual(formula.compile(bitwise=True)(masks['a'], masks['b'], full), 0b1001)
+
+    def test_compile_unknown_variable(self):
+        with self.assertRaises(ValueError):
+            Formula("a & b").compile(['a'])
+
+
+class TestFormulaTruthTableCache(unittest.TestCase):
+    def test_truth_table_is_shared(self):
+        formula = Formula("a ∨ b")
+        truth_table = formula.get_truth_table()
+        formula.to_dnf()
+        formula.to_cnf()
+        formula.get_number_forms()
+        formula.create_table_of_truth()
+        self.assertIs(formula.get_truth_table(), truth_table)
+
+    def test_cache_invalidated_by_expression(self):
+        formula = Formula("a ∨ b")
+        truth_table = formula.get_truth_table()
+        formula.expression = "a & b"
+        self.assertIsNot(formula.get_truth_table(), truth_table)
+        self.assertEqual(formula.to_dnf(), "(a ∧ b)")
+
+    def test_packed_representation(self):
+        truth_table = Formula("a → b").get_truth_table()
+        self.assertEqual(truth_table.variables, ['a', 'b'])
+        self.assertEqual(truth_table.to_bytes(), bytes([0b1011]))
+        restored = TruthTable.from_bytes(truth_table.variables, truth_table.to_bytes())
+        self.assertEqual(restored.get_rows(), truth_table.get_rows())
+        self.assertEqual(restored.minterms(), [0, 1, 3])
+        self.assertEqual(restored.maxterms(), [2])
+
+
+class TestFormulaZhegalkin(unittest.TestCase):
+    def test_known_polynomials(self):
+        self.assertEqual(Formula("a → b").to_zhegalkin(), "1 ⊕ a ⊕ (a ∧ b)")
+        self.assertEqual(Formula("a ↔ b").to_zhegalkin(), "1 ⊕ a ⊕ b")
+        self.assertEqual(Formula("a ∨ b ∨ c").to_zhegalkin(),
+                         "a ⊕ b ⊕ c ⊕ (a ∧ b) ⊕ (a ∧ c) ⊕ (b ∧ c) ⊕ (a ∧ b ∧ c)")
+        self.assertEqual(Formula("a ∧ !a").to_zhegalkin(), "0")
+        self.assertEqual(Formula("a ∨ !a").to_zhegalkin(), "1")
+
+    def test_matches_triangle_method(self):
+        for expr in ["(a∨b)∧!c", "!a→(!(b∨c)∨c)", "(a ↔ b) ∨ (c → d) ∧ !e"]:
+            with self.subTest(expr=expr):
+                formula = Formula(expr)
+                row = list(formula.get_truth_table().iter_values())
+                coefficients = []
+                while row:
+                    coefficients.append(row[0])
+                    row = [x != y for x, y in zip(row, row[1:])]
+                expected = sum(1 << i for i, bit in enumerate(coefficients) if bit)
+                self.assertEqual(formula.get_zhegalkin_vector(), expected)
+
+
+class TestFormulaPostClasses(unittest.TestCase):
+    @staticmethod
+    def brute_force(formula):
+        truth_table = formula.get_truth_table()
+        values = list(truth_table.iter_values())
+        rows = [truth_table.index_to_values(i) for i in range(truth_table.size)]
+        anf = formula.get_zhegalkin_vector()
+        return {
+            "T0": not values[0],
+            "T1": values[-1],
+            "S": all(values[i] != values[truth_table.size - 1 - i] for i in range(truth_table.size)),
+            "M": all(values[i] <= values[j] for i in range(truth_table.size) for j in range(truth_table.size)
+                     if all(x <= y for x, y in zip(rows[i], rows[j]))),
+            "L": all(bin(i).count("1") <= 1 for i in range(truth_table.size) if anf >> i & 1),
+        }
+
+    def test_classes(self):
+        self.assertEqual(Formula("a ∧ b").post_classes(),
+                         {"T0": True, "T1": True, "S": False, "M": True, "L": False})
+        self.assertEqual(Formula("!a").post_classes(),
+                         {"T0": False, "T1": False, "S": True, "M": False, "L": True})
+        self.assertEqual(Formula("(a ∧ b) ∨ (a ∧ c) ∨ (b ∧ c)").post_classes(),
+                         {"T0": True, "T1": True, "S": True, "M": True, "L": False})
+
+    def test_matches_brute_force(self):
+        for expr in ["(a∨b)∧!c", "!a→(!(b∨c)∨c)", "(a ↔ b) ↔ c", "a ∨ (b ∧ c)", "a & !a", "a → b"]:
+            with self.subTest(expr=expr):
+                formula = Formula(expr)
+                self.assertEqual(formula.post_classes(), self.brute_force(formula))
+
+    def test_functional_completeness(self):
+        self.assertTrue(Formula.is_functionally_complete([Formula("!(a ∧ b)")]))
+        self.assertTrue(Formula.is_functionally_complete([Formula("!a"), Formula("a ∧ b")]))
+        self.assertFalse(Formula.is_functionally_complete([Formula("a ∧ b"), Formula("a ∨ b")]))
+        self.assertFalse(Formula.is_functionally_complete([Formula("!a"), Formula("a ↔ b")]))
+
+
+class TestFormulaEquivalence(unittest.TestCase):
+    PAIRS = [
+        ("a → b", "!a ∨ b"),
+        ("a ∧ b", "a"),
+        ("a", "a ∧ b"),
+        ("(a ∨ b) ∧ !c", "(a ∧ !c) ∨ (b ∧ !c)"),
+        ("a ↔ b", "c"),
+        ("a", "a ∨ (b ∧ !b)"),
+        ("!(a ∧ b ∧ c)", "!a ∨ !b"),
+    ]
+
+    def test_equivalent(self):
+        self.assertEqual(Formula("a → b").equivalent(Formula("!a ∨ b")), (True, None))
+        self.assertEqual(Formula("a ∧ b").equivalent(Formula("a")), (False, {'a': True, 'b': False}))
+        self.assertEqual(Formula("a").equivalent(Formula("a ∨ (b ∧ !b)")), (True, None))
+
+    def test_implies(self):
+        self.assertEqual(Formula("a ∧ b").implies(Formula("a")), (True, None))
+        self.assertEqual(Formula("a").implies(Formula("a ∧ b")), (False, {'a': True, 'b': False}))
+        self.assertEqual(Formula("a ↔ b").implies(Formula("c")),
+                         (False, {'a': False, 'b': False, 'c': False}))
+
+    def test_search_matches_table(self):
+        for first, second in self.PAIRS:
+            for method in ("equivalent", "implies"):
+                with self.subTest(first=first, second=second, method=method):
+                    expected = getattr(Formula(first), method)(Formula(second))
+                    formula = Formula(first)
+                    formula.EQUIVALENCE_TABLE_LIMIT = 0
+                    self.assertEqual(getattr(formula, method)(Formula(second)), expected)
+
+    def test_minimal_model(self):
+        self.assertEqual(Formula("(a ∨ b) ∧ (!a ∨ c)").find_minimal_model(),
+                         {'a': False, 'b': True, 'c': False})
+        self.assertIsNone(Formula("a ∧ !a").find_minimal_model())
+
+
+class TestFormulaCache(unittest.TestCase):
+    def test_normalized_keys(self):
+        cache = FormulaCache()
+        first = cache.get("!(a→(b∧!c))")
+        self.assertIs(cache.get(" ! ( a -> ( b & ! c ) ) "), first)
+        self.assertIs(cache.get("!(a→(b∧¬c))"), first)
+        self.assertIsNot(cache.get("!(a→(b∧!c))", Formula.NUMPY), first)
+        self.assertEqual(cache.cache_info(), {"hits": 2, "misses": 2, "size": 2, "maxsize": 256})
+
+    def test_shared_truth_table(self):
+        cache = FormulaCache()
+        vector = cache.get("(a ∨ b) ∧ !c").get_truth_vector()
+        self.assertIs(cache.get("(a∨b)∧!c").get_truth_table().vector, vector)
+
+    def test_lru_eviction(self):
+        cache = FormulaCache(maxsize=2)
+        first = cache.get("a & b")
+        cache.get("a | b")
+        cache.get("a & b")
+        cache.get("a ~ b")
+        self.assertIs(cache.get("a & b"), first)
+        self.assertEqual(cache.cache_info()["size"], 2)
+        self.assertEqual(cache.misses, 3)
+        cache.get("a | b")
+        self.assertEqual(cache.misses, 4)
+
+    def test_interned(self):
+        self.assertIs(Formula.interned("a → b"), Formula.interned("a->b"))
+
+
+class TestFormulaSharding(unittest.TestCase):
+    def test_shard_masks(self):
+        masks, full = Formula.get_shard_masks(['a', 'b', 'c', 'd'], 8, 2)
+        self.assertEqual(full, 0xF)
+        self.assertEqual(masks, {'a': 0xF, 'b': 0, 'c': 0b1100, 'd': 0b1010})
+
+    def test_sharded_table_matches_serial(self):
+        expr = "(a ∨ b → c) ∧ (d ↔ !e) ∨ (f ∧ g ∧ !h) ∨ (i → j)"
+        sharded = Formula(expr).get_truth_table(workers=2)
+        self.assertEqual(sharded.variables, Formula(expr).get_variables())
+        self.assertEqual(sharded.vector, Formula(expr).get_truth_table(workers=1).vector)
+
+    def test_workers_not_power_of_two(self):
+        expr = "(a ∨ b → c) ∧ (d ↔ !e) ∨ (f ∧ g ∧ !h) ∨ (i → j)"
+        serial = Formula(expr).get_truth_table(workers=1).vector
+        for workers in (3, 5, 6):
+            with self.subTest(workers=workers):
+                self.assertEqual(Formula(expr).get_truth_table(workers=workers).vector, serial)
+
+
+class TestFormulaGrayCode(unittest.TestCase):
+    def test_matches_truth_table(self):
+        for expr in ["(a ∨ b) ∧ !c", "(a ↔ b) ∨ (c → d) ∧ !(a ↔ b)", "a & !a", "x"]:
+            with self.subTest(expr=expr):
+                formula = Formula(expr)
+                walk = list(formula.iter_gray_code())
+                _, _, results = formula.create_table_of_truth()
+                self.assertEqual(sorted(walk), list(enumerate(results)))
+
+    def test_one_variable_per_step(self):
+        indices = [index for index, _ in Formula("a → (b ∧ c)").iter_gray_code()]
+        self.assertEqual(indices[0], 0)
+        for previous, current in zip(indices, indices[1:]):
+            self.assertEqual(bin(previous ^ current).count("1"), 1)
+
+    def test_extra_variables(self):
+        formula = Formula("a ∧ b")
+        walk = dict(formula.iter_gray_code(['a', 'b', 'c']))
+        self.assertEqual([index for index in sorted(walk) if walk[index]], [6, 7])
+        with self.assertRaises(ValueError):
+            list(formula.iter_gray_code(['a']))
+
+
+class TestFormulaStreaming(unittest.TestCase):
+    def test_iter_terms(self):
+        formula = Formula("a ∧ !b")
+        self.assertEqual(list(formula.iter_dnf_terms()), ["(a ∧ ¬b)"])
+        self.assertEqual(list(formula.iter_cnf_clauses()), ["(a ∨ b)", "(a ∨ ¬b)", "(¬a ∨ ¬b)"])
+
+    def test_write_matches_strings(self):
+        formula = Formula("(a ↔ b) ∨ (c → d)")
+        buffer = io.StringIO()
+        self.assertEqual(formula.write_dnf(buffer), len(formula.get_truth_table().minterms()))
+        self.assertEqual(buffer.getvalue(), formula.to_dnf())
+        buffer = io.StringIO()
+        formula.write_cnf(buffer)
+        self.assertEqual(buffer.getvalue(), formula.to_cnf())
+
+    def test_write_constants(self):
+        buffer = io.StringIO()
+        self.assertEqual(Formula("a & !a").write_dnf(buffer), 0)
+        self.assertEqual(buffer.getvalue(), "False")
+        buffer = io.StringIO()
+        Formula("a | !a").write_cnf(buffer)
+        self.assertEqual(buffer.getvalue(), "True")
+
+
+class TestFormulaModels(unittest.TestCase):
+    def test_count_models(self):
+        for expr in ["a ∧ b", "(a ∨ b) ∧ !c", "(a ↔ b) ∨ (c → d)", "a & !a"]:
+            with self.subTest(expr=expr):
+                formula = Formula(expr)
+                _, _, results = formula.create_table_of_truth()
+                self.assertEqual(formula.count_models(), sum(results))
+
+    def test_satisfiability(self):
+        self.assertTrue(Formula("a ∧ !b").is_satisfiable())
+        self.assertFalse(Formula("a ∧ !a").is_satisfiable())
+        self.assertTrue(Formula("(a → b) ∨ (b → a)").is_tautology())
+        self.assertFalse(Formula("a → b").is_tautology())
+
+    def test_wide_formula(self):
+        names = [f"x{chr(97 + i // 26)}{chr(97 + i % 26)}" for i in range(48)]
+        expr = " ∧ ".join(f"({names[i]} ∨ !{names[i + 1]})" for i in range(47))
+        formula = Formula(expr)
+        self.assertEqual(formula.count_models(), 49)
+        self.assertTrue(formula.is_satisfiable())
+        self.assertFalse(formula.is_tautology())
+
+
+if __name__ == '__main__':
+    unittest.main()
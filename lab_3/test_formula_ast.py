@@ -0,0 +1,71 @@
+import pickle
+import unittest
+from formula import Formula
+from formula_ast import Node, Parser
+
+
+class TestNode(unittest.TestCase):
+    def test_hash_consing(self):
+        first = Node.operation('&', Node.variable('a'), Node.variable('b'))
+        second = Node.operation('&', Node.variable('a'), Node.variable('b'))
+        self.assertIs(first, second)
+        self.assertIsNot(first, Node.operation('&', Node.variable('b'), Node.variable('a')))
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            Node.variable('a').name = 'b'
+
+    def test_pickle(self):
+        node = Formula("(a ∧ b) ∨ !c").get_ast()
+        self.assertIs(pickle.loads(pickle.dumps(node)), node)
+
+    def test_shared_subexpressions(self):
+        node = Formula("(a ∧ b) ∨ !(a ∧ b)").get_ast()
+        self.assertEqual(len(list(node.iter_nodes())), 5)
+        self.assertEqual(node.to_postfix(), ['a', 'b', '&', 'a', 'b', '&', '!', '|'])
+
+
+class TestParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = Parser(Formula("a").operators)
+
+    def test_precedence(self):
+        self.assertEqual(str(self.parser.parse("a | b & c -> d ~ e")), "(((a|(b&c))->d)~e)")
+        self.assertEqual(str(self.parser.parse("a -> b -> c")), "((a->b)->c)")
+        self.assertEqual(str(self.parser.parse("!a & !!b")), "(!a&!!b)")
+
+    def test_unicode_operators(self):
+        self.assertIs(self.parser.parse("¬a ∧ b → c ↔ d"), self.parser.parse("!a & b -> c ~ d"))
+
+    def test_errors(self):
+        cases = {
+            "": "Пустое выражение",
+            "a & $": "позиции 4",
+            "(a | b": "Ожидалась ')' в позиции 6",
+            "a b": "Неожиданный символ 'b' в позиции 2",
+            "a &": "Неожиданный конец выражения в позиции 3",
+            "& a": "Неожиданный символ '&' в позиции 0",
+        }
+        for text, message in cases.items():
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError) as context:
+                    self.parser.parse(text)
+                self.assertIn(message, str(context.exception))
+
+    def test_deep_nesting(self):
+        text = "x0"
+        for i in range(1, 3000):
+            text = f"(x{i} | {text})"
+        node = self.parser.parse(text)
+        self.assertEqual(len(node.get_variables()), 3000)
+        self.assertEqual(node.to_postfix()[:3], ['x2999', 'x2998', 'x2997'])
+        self.assertIsNotNone(Formula(text).find_model())
+
+    def test_tokens_compatibility(self):
+        formula = Formula("!(a∨b)→c↔d")
+        self.assertEqual(formula.tokenize(), ['!', '(', 'a', '|', 'b', ')', '->', 'c', '~', 'd'])
+        self.assertEqual(formula.to_postfix(formula.tokenize()), formula.get_postfix())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import random
+import unittest
+from formula import Formula
+from formula_set import FormulaSet
+
+
+class TestFormulaSet(unittest.TestCase):
+    EXPRESSIONS = ["(a∨b)∧!c", "!(a∨b)", "(a∨b)∧!c → d", "a ↔ d", "x"]
+
+    def setUp(self):
+        self.formula_set = FormulaSet(self.EXPRESSIONS)
+
+    def test_shared_nodes(self):
+        separate = sum(len(list(Formula(expr).get_ast().iter_nodes())) for expr in self.EXPRESSIONS)
+        self.assertEqual(self.formula_set.variables, ['a', 'b', 'c', 'd', 'x'])
+        self.assertLess(self.formula_set.count_nodes(), separate)
+
+    def test_evaluate(self):
+        assignment = {'a': True, 'b': False, 'c': False, 'd': False, 'x': True}
+        expected = [Formula(expr).evaluate_of_expr(**{var: assignment[var] for var in Formula(expr).get_variables()})
+                    for expr in self.EXPRESSIONS]
+        self.assertEqual(self.formula_set.evaluate(assignment), expected)
+        with self.assertRaises(ValueError):
+            self.formula_set.evaluate({'a': True})
+
+    def test_evaluate_many(self):
+        generator = random.Random(7)
+        assignments = [{var: generator.random() < 0.5 for var in self.formula_set.variables}
+                       for _ in range(2 * FormulaSet.BLOCK_SIZE + 5)]
+        matrix = self.formula_set.evaluate_many(assignments)
+        self.assertEqual(len(matrix), len(assignments))
+        for assignment, row in zip(assignments, matrix):
+            self.assertEqual(row, self.formula_set.evaluate(assignment))
+        self.assertEqual(self.formula_set.evaluate_many([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
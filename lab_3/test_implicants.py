@@ -0,0 +1,53 @@
+import unittest
+from implicants import TermEncoder, absorb, coverage_rows, merge_round
+
+
+class TestTermEncoder(unittest.TestCase):
+    def setUp(self):
+        self.encoder = TermEncoder([{'a', '¬b'}, {'¬c'}])
+
+    def test_encode_decode(self):
+        self.assertEqual(self.encoder.variables, ['a', 'b', 'c'])
+        self.assertEqual(self.encoder.encode({'a', '¬b'}), (0b100, 0b110))
+        self.assertEqual(self.encoder.encode(set()), (0, 0))
+        self.assertEqual(self.encoder.decode((0b100, 0b110)), frozenset({'a', '¬b'}))
+
+    def test_contradiction(self):
+        self.assertIsNone(self.encoder.encode({'a', '¬a'}))
+        self.assertEqual(self.encoder.encode({'a', 'a'}), (0b100, 0b100))
+
+
+class TestMergeRound(unittest.TestCase):
+    def test_pairs_in_index_order(self):
+        encoder = TermEncoder([{'a', 'b'}])
+        terms = [{'a', 'b'}, {'¬a', '¬b'}, {'¬a', 'b'}, {'a', '¬b'}]
+        pairs = merge_round([encoder.encode(term) for term in terms])
+        self.assertEqual([(i, j) for i, j, _ in pairs], [(0, 2), (0, 3), (1, 2), (1, 3)])
+        self.assertEqual([encoder.decode(merged) for _, _, merged in pairs],
+                         [{'b'}, {'a'}, {'¬a'}, {'¬b'}])
+
+    def test_different_masks_do_not_merge(self):
+        encoder = TermEncoder([{'a', 'b', 'c'}])
+        terms = [{'a', 'b'}, {'¬a', 'c'}, {'a', '¬a'}, {'¬a'}]
+        self.assertEqual(merge_round([encoder.encode(term) for term in terms]), [])
+
+
+class TestAbsorb(unittest.TestCase):
+    def test_absorbed_and_duplicates(self):
+        encoder = TermEncoder([{'a', 'b', 'c'}])
+        terms = [{'a', 'b'}, {'a'}, {'¬a', 'b'}, {'a'}, {'a', '¬b', 'c'}, {'¬a', 'b', 'c'}, {'b', 'c'}]
+        self.assertEqual(absorb([encoder.encode(term) for term in terms]), [1, 2, 6])
+
+
+class TestCoverageRows(unittest.TestCase):
+    def test_rows_match_subset_check(self):
+        terms = [frozenset(t) for t in ({'a', 'b', 'c'}, {'a', '¬b', 'c'}, {'¬a', 'b'}, {'a', '¬a', 'b'}, {'b', 'c'})]
+        primes = [frozenset(p) for p in ({'a', 'c'}, {'b'}, {'¬a'}, {'a', '¬a'}, {'¬c'})]
+        encoder = TermEncoder(terms)
+        expected = [sum(1 << j for j, term in enumerate(terms) if prime <= term) for prime in primes]
+        self.assertEqual(coverage_rows(primes, terms, encoder), expected)
+        self.assertEqual(expected, [0b00011, 0b11101, 0b01100, 0b01000, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
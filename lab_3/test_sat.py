@@ -0,0 +1,117 @@
+import io
+import itertools
+import random
+import unittest
+from formula import Formula
+from sat import CDCLSolver, TseitinEncoder, read_dimacs
+
+
+def letters(index):
+    return "x" + chr(97 + index // 26 // 26 % 26) + chr(97 + index // 26 % 26) + chr(97 + index % 26)
+
+
+def satisfies(model, clauses):
+    return all(any((literal > 0) == model[abs(literal)] for literal in clause) for clause in clauses)
+
+
+class TestTseitinEncoder(unittest.TestCase):
+    def test_linear_size(self):
+        encoder = TseitinEncoder(Formula("(a ∧ b) ∨ !(c → d) ↔ (a ∧ b)"))
+        self.assertEqual(encoder.names, ['a', 'b', 'c', 'd'])
+        self.assertEqual(len(encoder.gates), 4)
+        self.assertEqual(encoder.num_clauses, len(list(encoder.iter_clauses())))
+
+    def test_clauses_define_gates(self):
+        for operator, function in (('&', lambda a, b: a and b), ('|', lambda a, b: a or b),
+                                   ('->', lambda a, b: not a or b), ('~', lambda a, b: a == b)):
+            clauses = TseitinEncoder.gate_clauses(3, operator, 1, 2)
+            for a, b, x in itertools.product([False, True], repeat=3):
+                model = [None, a, b, x]
+                with self.subTest(operator=operator, a=a, b=b, x=x):
+                    self.assertEqual(satisfies(model, clauses), x == function(a, b))
+
+
+class TestDimacsExport(unittest.TestCase):
+    def test_header_and_clauses(self):
+        dimacs = Formula("a ∧ !b").to_tseitin_cnf()
+        self.assertEqual(dimacs, "c 1 a\nc 2 b\np cnf 3 4\n-3 1 0\n-3 -2 0\n3 -1 2 0\n3 0\n")
+
+    def test_model_count_is_preserved(self):
+        for expr in ["(a ∨ b) ∧ !c", "(a ↔ b) ∨ (c → d)", "!(a→(b∧!c))", "a & !a"]:
+            with self.subTest(expr=expr):
+                formula = Formula(expr)
+                buffer = io.StringIO()
+                num_vars, num_clauses = formula.write_tseitin_cnf(buffer)
+                buffer.seek(0)
+                read_vars, clauses = read_dimacs(buffer)
+                self.assertEqual((read_vars, len(clauses)), (num_vars, num_clauses))
+                count = sum(satisfies([None] + list(values), clauses)
+                            for values in itertools.product([False, True], repeat=num_vars))
+                self.assertEqual(count, formula.count_models())
+
+    def test_size_is_linear(self):
+        expr = " ∧ ".join(f"({letters(i)} ∨ {letters(i + 1)})" for i in range(400))
+        buffer = io.StringIO()
+        num_vars, num_clauses = Formula(expr).write_tseitin_cnf(buffer)
+        self.assertEqual(num_vars, 401 + 799)
+        self.assertEqual(num_clauses, 3 * 799 + 1)
+
+
+class TestCDCLSolver(unittest.TestCase):
+    def test_luby(self):
+        self.assertEqual([CDCLSolver.luby(i) for i in range(15)], [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8])
+
+    def test_random_cnf_against_brute_force(self):
+        generator = random.Random(3)
+        for _ in range(100):
+            n = generator.randint(3, 8)
+            clauses = [[generator.choice([-1, 1]) * generator.randint(1, n) for _ in range(3)]
+                       for _ in range(generator.randint(1, 40))]
+            model = CDCLSolver(n, clauses).solve()
+            brute = any(satisfies([None] + list(values), clauses)
+                        for values in itertools.product([False, True], repeat=n))
+            self.assertEqual(model is not None, brute)
+            if model is not None:
+                self.assertTrue(satisfies(model, clauses))
+
+    def test_empty_clause(self):
+        self.assertIsNone(CDCLSolver(2, [[1], [-1, 2], [-2]]).solve())
+        self.assertIsNone(CDCLSolver(1, [[]]).solve())
+
+    def test_pigeonhole_is_unsat(self):
+        pigeons, holes = 5, 4
+        name = {(p, h): letters(p * holes + h) for p in range(pigeons) for h in range(holes)}
+        parts = ["(" + " ∨ ".join(name[p, h] for h in range(holes)) + ")" for p in range(pigeons)]
+        for h in range(holes):
+            for p, q in itertools.combinations(range(pigeons), 2):
+                parts.append(f"!({name[p, h]} ∧ {name[q, h]})")
+        self.assertIsNone(Formula(" ∧ ".join(parts)).find_model())
+
+    def test_hundreds_of_variables(self):
+        generator = random.Random(11)
+        count = 300
+        clauses = []
+        for _ in range(int(count * 3.5)):
+            picked = generator.sample(range(count), 3)
+            clauses.append("(" + " ∨ ".join(("!" if generator.random() < 0.5 else "") + letters(v)
+                                             for v in picked) + ")")
+        formula = Formula(" ∧ ".join(clauses))
+        model = formula.find_model()
+        self.assertIsNotNone(model)
+        self.assertEqual(len(model), count)
+        self.assertTrue(formula.evaluate_of_expr(**model))
+
+
+class TestFormulaFindModel(unittest.TestCase):
+    def test_models_satisfy_formula(self):
+        for expr in ["a ∧ !b", "(a → b) ∧ (b → c) ∧ a", "(a ↔ b) ∧ !(a ∨ b)", "a ∧ !a", "!(a→(b∧!c))"]:
+            with self.subTest(expr=expr):
+                formula = Formula(expr)
+                model = formula.find_model()
+                self.assertEqual(model is not None, formula.is_satisfiable())
+                if model is not None:
+                    self.assertTrue(formula.evaluate_of_expr(**model))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+from formula import Formula
+from karnaugh_template import KarnaughMapProcessor
+from minimize_dnf_calculative import DNFMinimizer
+from table_file import TruthTableFile
+
+
+class TestTruthTableFile(unittest.TestCase):
+    def setUp(self):
+        descriptor, self.path = tempfile.mkstemp(suffix='.ttbl')
+        os.close(descriptor)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        formula = Formula("(a ∨ b) ∧ !c")
+        formula.save_truth_table(self.path)
+        with TruthTableFile(self.path) as table_file:
+            self.assertEqual(table_file.variables, ['a', 'b', 'c'])
+            self.assertEqual(table_file.expression, formula.expression)
+            self.assertEqual(table_file.offset % TruthTableFile.ALIGNMENT, 0)
+            values = table_file.values()
+            self.assertEqual(values.tolist(), formula.create_table_of_truth()[2])
+            del values
+        loaded = Formula.from_table_file(self.path)
+        self.assertEqual(loaded.get_truth_vector(), formula.get_truth_vector())
+        self.assertEqual(loaded.to_dnf(), formula.to_dnf())
+
+    def test_zero_copy_view(self):
+        expr = " ∧ ".join(f"(x{i} ∨ y{i})" for i in range(6))
+        Formula(expr).save_truth_table(self.path)
+        with TruthTableFile(self.path) as table_file:
+            packed = table_file.packed()
+            self.assertFalse(packed.flags.owndata)
+            self.assertEqual(len(packed), (1 << 12) // 8)
+            self.assertEqual(int(np.unpackbits(packed).sum()), 3 ** 6)
+            del packed
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a truth table')
+        with self.assertRaises(ValueError):
+            TruthTableFile(self.path)
+        with self.assertRaises(ValueError):
+            TruthTableFile.write(self.path, ['a', 'b'], b'\x00\x00', "a ∧ b")
+        with self.assertRaises(ValueError):
+            TruthTableFile.write(self.path, ['a', 'b'], b'\x08', "")
+
+    def test_invalid_header(self):
+        for header in ({"variables": ['a']}, {"expression": "a"}, ['a'], {"variables": 'a', "expression": "a"}):
+            with self.subTest(header=header):
+                data = json.dumps(header).encode('utf-8')
+                with open(self.path, 'wb') as file:
+                    file.write(TruthTableFile.PREFIX.pack(TruthTableFile.MAGIC, TruthTableFile.VERSION, len(data)))
+                    file.write(data + b'\0' * 8)
+                with self.assertRaises(ValueError):
+                    TruthTableFile(self.path)
+
+    def test_consumers(self):
+        formula = Formula("!(a→(b∧!c))")
+        formula.save_truth_table(self.path)
+        minimizer = DNFMinimizer.from_table_file(self.path)
+        self.assertEqual(minimizer.minimize_expression(),
+                         DNFMinimizer(formula.get_dnf_for_minimization()).minimize_expression())
+        processor = KarnaughMapProcessor.from_table_file(self.path, False)
+        rows, headers, _ = formula.create_table_of_truth()
+        self.assertEqual(str(processor.compute_minimized_form()),
+                         str(KarnaughMapProcessor(headers[:-1], rows, False).compute_minimized_form()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import tracemalloc
+import unittest
+from formula import Formula
+from karnaugh_template import KarnaughMapProcessor
+from vectorized import VectorizedTable
+
+
+class TestVectorizedTable(unittest.TestCase):
+    EXPRESSIONS = ["(a∨b)∧!c", "!a→(!(b∨c)∨c)", "(a ↔ b) ∨ (c → d)", "a & !a", "x1 | x2 -> x3"]
+
+    def test_variable_columns(self):
+        columns = VectorizedTable.variable_columns(3)
+        self.assertEqual(columns.shape, (8, 3))
+        self.assertEqual(columns[:, 0].tolist(), [False] * 4 + [True] * 4)
+        self.assertEqual(columns[:, 2].tolist(), [False, True] * 4)
+
+    def test_variable_columns_memory(self):
+        # Без промежуточной таблицы в uint64, которая в 8 раз больше итоговой
+        tracemalloc.start()
+        try:
+            columns = VectorizedTable.variable_columns(16)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 2 * columns.nbytes)
+
+    def test_matches_bitwise_backend(self):
+        for expr in self.EXPRESSIONS:
+            with self.subTest(expr=expr):
+                bitwise = Formula(expr)
+                vectorized = Formula(expr, backend=Formula.NUMPY)
+                self.assertEqual(vectorized.get_truth_vector(), bitwise.get_truth_vector())
+                self.assertEqual(vectorized.get_number_forms(), bitwise.get_number_forms())
+                rows, headers, results = vectorized.create_table_of_truth()
+                expected_rows, expected_headers, expected_results = bitwise.create_table_of_truth()
+                self.assertEqual(rows, expected_rows)
+                self.assertEqual(headers, expected_headers)
+                self.assertEqual(results, expected_results)
+
+    def test_karnaugh_processor(self):
+        for expr in ["(a∨b)∧!c", "(a ↔ b) ∨ (c → d)"]:
+            for conjunctive in (False, True):
+                with self.subTest(expr=expr, conjunctive=conjunctive):
+                    results = []
+                    for backend in (Formula.BITWISE, Formula.NUMPY):
+                        rows, headers, _ = Formula(expr, backend=backend).create_table_of_truth()
+                        results.append(str(KarnaughMapProcessor(headers[:-1], rows, conjunctive).compute_minimized_form()))
+                    self.assertEqual(results[1], results[0])
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            Formula("a", backend="gpu")
+
+
+class TestWalshSpectrum(unittest.TestCase):
+    @staticmethod
+    def brute_force(formula):
+        truth_table = formula.get_truth_table()
+        values = list(truth_table.iter_values())
+        return [sum((-1) ** (values[x] ^ (bin(x & w).count("1") & 1)) for x in range(truth_table.size))
+                for w in range(truth_table.size)]
+
+    def test_matches_definition(self):
+        for expr in TestVectorizedTable.EXPRESSIONS:
+            with self.subTest(expr=expr):
+                formula = Formula(expr)
+                self.assertEqual(formula.walsh_spectrum().tolist(), self.brute_force(formula))
+
+    def test_metrics(self):
+        xor = Formula("!(a ↔ b) ↔ c")
+        self.assertTrue(xor.is_balanced())
+        self.assertEqual(xor.nonlinearity(), 0)
+        self.assertEqual(xor.correlation_immunity(), 2)
+        bent = Formula("!((a ∧ b) ↔ (c ∧ d))")
+        self.assertFalse(bent.is_balanced())
+        self.assertEqual(bent.nonlinearity(), 6)
+        self.assertEqual(bent.correlation_immunity(), 0)
+        majority = Formula("(a ∧ b) ∨ (a ∧ c) ∨ (b ∧ c)")
+        self.assertTrue(majority.is_balanced())
+        self.assertEqual(majority.nonlinearity(), 2)
+        self.assertEqual(majority.correlation_immunity(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class VectorizedTable:
+    # Таблица истинности в виде массивов NumPy: столбец на переменную,
+    # строка на набор, порядок строк как в TruthTable
+    LOGICAL = {
+        '!': np.logical_not,
+        '&': np.logical_and,
+        '|': np.logical_or,
+        '->': lambda a, b: np.logical_or(np.logical_not(a), b),
+        '~': np.equal,
+    }
+
+    def __init__(self, variables, columns, values):
+        self.variables = list(variables)
+        self.columns = columns
+        self.values = values
+
+    @staticmethod
+    def variable_columns(count):
+        # Столбцы заполняются по одному из номеров строк наименьшего
+        # подходящего типа: временные массивы - один столбец, а не вся
+        # таблица в uint64. Столбец переменной лежит в памяти подряд
+        rows = np.arange(1 << count, dtype=np.min_scalar_type((1 << count) - 1))
+        columns = np.empty((len(rows), count), dtype=bool, order='F')
+        for position in range(count):
+            columns[:, position] = rows >> (count - position - 1) & 1
+        return columns
+
+    @classmethod
+    def from_ast(cls, root, variables):
+        columns = cls.variable_columns(len(variables))
+        positions = {var: i for i, var in enumerate(variables)}
+        values = {}
+        for node in root.iter_nodes():
+            if node.is_variable:
+                if node.name not in positions:
+                    raise ValueError(f"Не указаны переменные: {{'{node.name}'}}")
+                values[node] = columns[:, positions[node.name]]
+            else:
+                values[node] = cls.LOGICAL[node.operator](*(values[child] for child in node.children))
+        return cls(variables, columns, np.ascontiguousarray(values[root], dtype=bool))
+
+    def minterms(self):
+        return np.flatnonzero(self.values)
+
+    def maxterms(self):
+        return np.flatnonzero(~self.values)
+
+    def get_rows(self):
+        return np.column_stack((self.columns, self.values))
+
+    def to_bytes(self):
+        return np.packbits(self.values, bitorder='little').tobytes()
+
+
+def unpack_values(data, size):
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=size, bitorder='little').astype(bool)
+
+
+def walsh_hadamard(values):
+    # Быстрое преобразование Уолша-Адамара над (-1)^f, O(n * 2^n)
+    spectrum = 1 - 2 * np.asarray(values, dtype=np.int64)
+    block = 1
+    while block < len(spectrum):
+        pairs = spectrum.reshape(-1, 2, block)
+        spectrum = np.stack((pairs[:, 0] + pairs[:, 1], pairs[:, 0] - pairs[:, 1]), axis=1).ravel()
+        block *= 2
+    return spectrum
+
+
+def popcounts(size):
+    weights = np.zeros(size, dtype=np.int64)
+    bit = 1
+    while bit < size:
+        weights[bit:2 * bit] = weights[:bit] + 1
+        bit *= 2
+    return weights
@@ -1,5 +1,5 @@
-import re
 from itertools import product
+from formula_ast import Parser
 
 
 class Formula:
@@ -45,8 +45,11 @@ class Formula:
             return -cls.binary_to_decimal_number(inverted) - 1
         return cls.binary_to_decimal_number(binary_number)
 
+    def get_ast(self):
+        return Parser(self.operators).parse(self.expression)
+
     def get_variables(self):
-        return sorted(set(re.findall(r'\b[a-zA-Z]+\b', self.expression)))
+        return self.get_ast().get_variables()
 
     def combinations(self):
         variables = self.get_variables()
@@ -54,44 +57,11 @@ class Formula:
             yield dict(zip(variables, combination))
 
     def tokenize(self):
-        tokens = []
-        i = 0
-        while i < len(self.expression):
-            if self.expression[i] == '-' and i + 1 < len(self.expression) and self.expression[i + 1] == '>':
-                tokens.append('->')
-                i += 2
-            elif self.expression[i] in "()!&|~":
-                tokens.append(self.expression[i])
-                i += 1
-            elif self.expression[i].isalpha():
-                var = []
-                while i < len(self.expression) and (self.expression[i].isalpha() or self.expression[i].isdigit()):
-                    var.append(self.expression[i])
-                    i += 1
-                tokens.append(''.join(var))
-            else:
-                i += 1
-        return tokens
+        return [token for token, _ in Parser(self.operators).tokenize(self.expression)]
 
     def to_postfix(self, tokens):
-        output = []
-        stack = []
-        for token in tokens:
-            if token == '(':
-                stack.append(token)
-            elif token == ')':
-                while stack[-1] != '(':
-                    output.append(stack.pop())
-                stack.pop()
-            elif token in self.operators:
-                while stack and stack[-1] != '(' and self.operators[token]["priority"] <= self.operators.get(stack[-1], {"priority": -1})["priority"]:
-                    output.append(stack.pop())
-                stack.append(token)
-            else:
-                output.append(token)
-        while stack:
-            output.append(stack.pop())
-        return output
+        positioned = [(token, position) for position, token in enumerate(tokens)]
+        return Parser(self.operators).parse_tokens(positioned).to_postfix()
 
     def evaluate_postfix(self, postfix, variables):
         stack = []
@@ -118,12 +88,11 @@ class Formula:
         return stack[0]
 
     def evaluate_of_expr(self, **variables):
-        tokens = self.tokenize()
-        missing = set(t for t in tokens if t.isalpha()) - set(variables.keys())
+        ast = self.get_ast()
+        missing = set(ast.get_variables()) - set(variables.keys())
         if missing:
             raise ValueError(f"Не указаны переменные: {missing}")
-        postfix = self.to_postfix(tokens)
-        return self.evaluate_postfix(postfix, variables)
+        return self.evaluate_postfix(ast.to_postfix(), variables)
 
     def create_table_of_truth(self):
         variables = self.get_variables()
@@ -186,7 +155,7 @@ class Formula:
 
 
 def main():
-    expr = ('!a→(!(b∨c))c'
+    expr = ('!a→(!(b∨c)∨c)'
             ''
             '')
     formula = Formula(expr)